@@ -81,14 +81,18 @@ def _process_instance(instance: InstanceConfig, opts) -> None:
     if instance.type == "sonarr":
         client = SonarrClient(instance.url, instance.api_key)
         taggarr_data = json_store.load(json_path, key="series")
+        before = dict(taggarr_data["series"])
         taggarr_data = tv.process_all(client, instance, opts, taggarr_data)
-        json_store.save(json_path, taggarr_data, key="series")
+        dirty = json_store.changed_keys(before, taggarr_data["series"])
+        json_store.save(json_path, taggarr_data, key="series", dirty=dirty)
 
     elif instance.type == "radarr":
         client = RadarrClient(instance.url, instance.api_key)
         taggarr_data = json_store.load(json_path, key="movies")
+        before = dict(taggarr_data["movies"])
         taggarr_data = movies.process_all(client, instance, opts, taggarr_data)
-        json_store.save(json_path, taggarr_data, key="movies")
+        dirty = json_store.changed_keys(before, taggarr_data["movies"])
+        json_store.save(json_path, taggarr_data, key="movies", dirty=dirty)
 
 
 def run_loop(opts, config: Config):
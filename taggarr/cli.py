@@ -0,0 +1,43 @@
+"""Command line argument parsing."""
+
+import argparse
+from functools import lru_cache
+
+from taggarr import __description__
+
+
+@lru_cache(maxsize=1)
+def get_parser() -> argparse.ArgumentParser:
+    """Build the taggarr argument parser once per process."""
+    parser = argparse.ArgumentParser(description=__description__)
+    parser.add_argument(
+        '--config', '-c',
+        help="Path to config file (default: searches standard locations)"
+    )
+    parser.add_argument(
+        '--instances', '-i',
+        help="Comma-separated list of instances to process (default: all)"
+    )
+    parser.add_argument(
+        '--write-mode', type=int, choices=[0, 1, 2],
+        default=0,
+        help="0=default, 1=rewrite all, 2=remove all"
+    )
+    parser.add_argument(
+        '--quick', action='store_true',
+        help="Scan only first episode per season"
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help="No API calls or file edits"
+    )
+    parser.add_argument(
+        '--loop', action='store_true',
+        help="Run continuously at configured interval"
+    )
+    return parser
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse CLI arguments (defaults to sys.argv[1:])."""
+    return get_parser().parse_args(argv)
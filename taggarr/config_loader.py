@@ -12,6 +12,9 @@ from taggarr.config_schema import (
 )
 
 
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+
 class ConfigError(Exception):
     """Configuration loading error."""
     pass
@@ -115,6 +118,7 @@ def _parse_defaults(raw: dict) -> DefaultsConfig:
         tags=tags,
         dry_run=raw.get("dry_run", False),
         quick_mode=raw.get("quick_mode", False),
+        scan_workers=raw.get("scan_workers", 4),
         run_interval_seconds=raw.get("run_interval_seconds", 7200),
         log_level=_interpolate(raw.get("log_level", "INFO")),
         log_path=_interpolate(raw.get("log_path", "/logs")),
@@ -155,6 +159,7 @@ def _parse_instance(name: str, raw: dict, defaults: DefaultsConfig) -> InstanceC
         tags=tags,
         dry_run=raw.get("dry_run", defaults.dry_run),
         quick_mode=raw.get("quick_mode", defaults.quick_mode),
+        scan_workers=raw.get("scan_workers", defaults.scan_workers),
         target_genre=_interpolate(raw.get("target_genre")) if raw.get("target_genre") else None,
     )
 
@@ -166,8 +171,6 @@ def _interpolate(value: "Optional[str]") -> "Optional[str]":
     if not isinstance(value, str):
         return value
 
-    pattern = re.compile(r'\$\{([^}]+)\}')
-
     def replacer(match):
         var_name = match.group(1)
         env_value = os.environ.get(var_name)
@@ -175,4 +178,4 @@ def _interpolate(value: "Optional[str]") -> "Optional[str]":
             raise ConfigError(f"Environment variable not set: {var_name}")
         return env_value
 
-    return pattern.sub(replacer, value)
+    return _ENV_VAR_RE.sub(replacer, value)
@@ -19,6 +19,7 @@ class DefaultsConfig:
     tags: TagsConfig = field(default_factory=TagsConfig)
     dry_run: bool = False
     quick_mode: bool = False
+    scan_workers: int = 4
     run_interval_seconds: int = 7200
     log_level: str = "INFO"
     log_path: str = "/logs"
@@ -36,6 +37,7 @@ class InstanceConfig:
     tags: TagsConfig = field(default_factory=TagsConfig)
     dry_run: bool = False
     quick_mode: bool = False
+    scan_workers: int = 4
     target_genre: Optional[str] = None
 
 
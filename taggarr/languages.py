@@ -1,24 +1,49 @@
 """Language code utilities using pycountry."""
 
+from functools import lru_cache
+
 import pycountry
 
+# Lookup precedence matches the old get(alpha_2) -> get(alpha_3) -> lookup() chain
+_INDEX_FIELDS = ('alpha_2', 'alpha_3', 'name', 'common_name', 'inverted_name', 'bibliographic')
+
+
+@lru_cache(maxsize=1)
+def _language_index():
+    """Build a single lowercase code/name -> language table from the pycountry catalog."""
+    index = {}
+    for field in _INDEX_FIELDS:
+        for lang in pycountry.languages:
+            value = getattr(lang, field, None)
+            if value:
+                index.setdefault(value.lower(), lang)
+    return index
+
 
+def _find_language(code_or_name):
+    """Resolve a language by code or name, falling back to pycountry's full lookup."""
+    lang = _language_index().get(code_or_name.lower())
+    if lang is None:
+        lang = pycountry.languages.lookup(code_or_name)
+    return lang
+
+
+@lru_cache(maxsize=4096)
 def get_aliases(code_or_name):
-    """Get all known aliases for a language (alpha_2, alpha_3, name, regional variants)."""
+    """Get all known aliases for a language (alpha_2, alpha_3, name, regional variants).
+
+    Results are memoized and returned as a frozenset so the cached value can't be mutated.
+    """
     if not code_or_name:
-        return set()
+        return frozenset()
 
     code_or_name = code_or_name.lower()
     aliases = set()
 
     try:
-        lang = (
-            pycountry.languages.get(alpha_2=code_or_name)
-            or pycountry.languages.get(alpha_3=code_or_name)
-            or pycountry.languages.lookup(code_or_name)
-        )
+        lang = _find_language(code_or_name)
     except Exception:
-        return aliases
+        return frozenset()
 
     if lang:
         if hasattr(lang, 'alpha_2'):
@@ -31,13 +56,14 @@ def get_aliases(code_or_name):
     for suffix in ['-us', '-gb', '-ca', '-au', '-fr', '-de', '-jp', '-kr', '-cn', '-tw', '-ru']:
         aliases.update(a + suffix for a in list(aliases))
 
-    return aliases
+    return frozenset(aliases)
 
 
+@lru_cache(maxsize=4096)
 def get_primary_code(lang):
     """Get ISO 639-1 code (2-letter) for a language."""
     try:
-        result = pycountry.languages.get(name=lang) or pycountry.languages.lookup(lang)
+        result = pycountry.languages.get(name=lang) or _find_language(lang)
         return result.alpha_2.lower()
     except Exception:
         return lang.lower()[:2]
@@ -1,12 +1,13 @@
 """NFO file parsing and updates for Kodi/Emby."""
 
+import io
 import os
 import logging
 import xml.etree.ElementTree as ET
 
 logger = logging.getLogger("taggarr")
 
-MANAGED_TAGS = {"dub", "semi-dub", "wrong-dub"}
+MANAGED_TAGS = frozenset({"dub", "semi-dub", "wrong-dub"})
 
 
 def safe_parse(path):
@@ -18,19 +19,32 @@ def safe_parse(path):
     return ET.fromstring(content)
 
 
-def get_genres(nfo_path):
-    """Extract genre list from NFO file."""
+def load(nfo_path):
+    """Parse NFO file, returning its root element or None on failure."""
     try:
-        root = safe_parse(nfo_path)
+        return safe_parse(nfo_path)
+    except Exception as e:
+        logger.warning(f"NFO parsing failed for {nfo_path}: {e}")
+        return None
+
+
+def get_genres(nfo_path, root=None):
+    """Extract genre list from NFO file, or from its already-parsed root."""
+    try:
+        if root is None:
+            root = safe_parse(nfo_path)
         return [g.text.lower() for g in root.findall("genre") if g.text]
     except Exception as e:
         logger.warning(f"Genre parsing failed for {nfo_path}: {e}")
         return []
 
 
-def update_tag(nfo_path, tag_value, dry_run=False):
-    """Update <tag> element in TV show NFO file."""
-    _update_tag_impl(nfo_path, tag_value, dry_run)
+def update_tag(nfo_path, tag_value, dry_run=False, root=None):
+    """Update <tag> element in TV show NFO file.
+
+    Pass ``root`` to reuse a tree already parsed from ``nfo_path``.
+    """
+    _update_tag_impl(nfo_path, tag_value, dry_run, root=root)
 
 
 def update_movie_tag(nfo_path, tag_value, dry_run=False):
@@ -38,16 +52,18 @@ def update_movie_tag(nfo_path, tag_value, dry_run=False):
     _update_tag_impl(nfo_path, tag_value, dry_run, is_movie=True)
 
 
-def _update_tag_impl(nfo_path, tag_value, dry_run, is_movie=False):
+def _update_tag_impl(nfo_path, tag_value, dry_run, is_movie=False, root=None):
     """Shared implementation for tag updates."""
     try:
-        tree = ET.parse(nfo_path)
-        root = tree.getroot()
+        if root is None:
+            root = ET.parse(nfo_path).getroot()
+        tree = ET.ElementTree(root)
+        indented = _is_indented(root)
 
         # Remove existing managed tags
         for t in root.findall("tag"):
             if t.text and t.text.strip().lower() in MANAGED_TAGS:
-                root.remove(t)
+                _remove_child(root, t)
 
         # Insert new tag at first position
         new_tag = ET.Element("tag")
@@ -58,19 +74,71 @@ def _update_tag_impl(nfo_path, tag_value, dry_run, is_movie=False):
             if elem.tag == "tag":
                 insert_index = i
                 break
-        root.insert(insert_index, new_tag)
+        _insert_child(root, insert_index, new_tag)
 
         if dry_run:
             logger.info(f"[Dry Run] Would update <tag>{tag_value}</tag> in {os.path.basename(nfo_path)}")
         else:
-            ET.indent(tree, space="  ")
-            tree.write(nfo_path, encoding="utf-8", xml_declaration=False)
+            if not indented:
+                ET.indent(tree, space="  ")
             label = "movie NFO" if is_movie else "NFO"
-            logger.info(f"Updated <tag>{tag_value}</tag> in {label}: {os.path.basename(nfo_path)}")
+            if _write_if_changed(tree, nfo_path):
+                logger.info(f"Updated <tag>{tag_value}</tag> in {label}: {os.path.basename(nfo_path)}")
+            else:
+                logger.debug(f"<tag>{tag_value}</tag> already current in {label}: {os.path.basename(nfo_path)}")
     except Exception as e:
         logger.warning(f"Failed to update <tag> in NFO: {e}")
 
 
+def _write_if_changed(tree, nfo_path):
+    """Write tree to nfo_path unless the file already holds the same bytes.
+
+    Leaving identical files alone keeps their mtime, so media servers don't
+    rescan them. Returns True if the file was written.
+    """
+    buf = io.BytesIO()
+    tree.write(buf, encoding="utf-8", xml_declaration=False)
+    content = buf.getvalue()
+    try:
+        with open(nfo_path, "rb") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(nfo_path, "wb") as f:
+        f.write(content)
+    return True
+
+
+def _is_indented(root):
+    """Return True if the document's children are already laid out on their own lines."""
+    return len(root) > 0 and bool(root.text) and not root.text.strip()
+
+
+def _insert_child(parent, index, child):
+    """Insert child at index, reusing the whitespace its siblings already have.
+
+    This keeps an indented document indented without re-walking the whole
+    tree through ET.indent.
+    """
+    children = list(parent)
+    if index < len(children):
+        child.tail = parent.text if index == 0 else children[index - 1].tail
+    elif children:
+        last = children[-1]
+        child.tail = last.tail
+        last.tail = parent.text if len(children) == 1 else children[-2].tail
+    parent.insert(index, child)
+
+
+def _remove_child(parent, child):
+    """Remove child, keeping the closing tag's indentation if it was the last one."""
+    children = list(parent)
+    if len(children) > 1 and children[-1] is child:
+        children[-2].tail = child.tail
+    parent.remove(child)
+
+
 def update_genre(nfo_path, should_have_dub, dry_run=False):
     """Add or remove <genre>Dub</genre> based on tag status."""
     try:
@@ -82,6 +150,7 @@ def update_genre(nfo_path, should_have_dub, dry_run=False):
         if should_have_dub == has_dub:
             return  # No change needed
 
+        indented = _is_indented(root)
         modified = False
 
         if should_have_dub and not has_dub:
@@ -92,20 +161,21 @@ def update_genre(nfo_path, should_have_dub, dry_run=False):
                 idx = list(root).index(first_genre)
             else:
                 idx = len(root)
-            root.insert(idx, new_genre)
+            _insert_child(root, idx, new_genre)
             modified = True
             logger.info(f"Adding <genre>Dub</genre> to {os.path.basename(nfo_path)}")
 
         elif not should_have_dub and has_dub:
             for g in root.findall("genre"):
                 if g.text and g.text.strip().lower() == "dub":
-                    root.remove(g)
+                    _remove_child(root, g)
                     modified = True
             logger.info(f"Removing <genre>Dub</genre> from {os.path.basename(nfo_path)}")
 
         if modified and not dry_run:
-            ET.indent(tree, space="  ")
-            tree.write(nfo_path, encoding="utf-8", xml_declaration=False)
+            if not indented:
+                ET.indent(tree, space="  ")
+            _write_if_changed(tree, nfo_path)
         elif modified and dry_run:
             logger.info(f"[Dry Run] Would update NFO file: {os.path.basename(nfo_path)}")
 
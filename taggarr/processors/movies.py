@@ -2,16 +2,18 @@
 
 import os
 import logging
-from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from taggarr.config_schema import InstanceConfig
 from taggarr.services.radarr import RadarrClient
 from taggarr.services import media
+from taggarr.storage import json_store
 from taggarr import nfo, languages
 
 logger = logging.getLogger("taggarr")
 
+IGNORE_PATTERNS = ('-sample', 'sample.', 'extras', 'featurettes', 'behind the scenes', 'deleted scenes')
+
 
 def process_all(client: RadarrClient, instance: InstanceConfig, opts, taggarr_movies: dict) -> dict:
     """Process all movies for a Radarr instance."""
@@ -20,127 +22,143 @@ def process_all(client: RadarrClient, instance: InstanceConfig, opts, taggarr_mo
     write_mode = opts.write_mode
 
     language_codes = languages.build_language_codes(instance.target_languages)
+    target_genre = instance.target_genre.lower() if instance.target_genre else None
+    # One timestamp for the whole run rather than formatting one per movie
+    scanned_at = json_store.scan_time()
+    tag_groups: Dict[Optional[str], List[int]] = {}
 
     logger.info("Starting movie scan...")
 
-    for movie_folder in sorted(os.listdir(instance.root_path)):
-        movie_path = os.path.abspath(os.path.join(instance.root_path, movie_folder))
-        if not os.path.isdir(movie_path):
-            continue
+    # Entries of an absolute root already carry normalized absolute paths
+    with os.scandir(os.path.abspath(instance.root_path)) as it:
+        movie_dirs = sorted((e.name, e.path) for e in it if e.is_dir())
+
+    for movie_folder, movie_path in movie_dirs:
 
         # Skip non-movie items
         if movie_folder.startswith('.') or movie_folder.endswith('.json'):
             continue
 
-        saved = taggarr_movies["movies"].get(movie_path, {})
-        saved_mtime = saved.get("last_modified", 0)
-
-        # Get current mtime
+        # One bad folder must not drop the tags staged for the rest
         try:
-            current_mtime = max(
-                os.path.getmtime(os.path.join(root, f))
-                for root, dirs, files in os.walk(movie_path)
-                for f in files if f.endswith(('.mkv', '.mp4', '.m4v', '.avi'))
+            result = _process_movie(
+                client, instance, movie_folder, movie_path, taggarr_movies,
+                language_codes, target_genre, dry_run, write_mode, scanned_at,
             )
-        except ValueError:
-            current_mtime = 0
+        except Exception as e:
+            logger.error(f"Failed to process movie {movie_folder}: {e}")
+            continue
 
-        is_new = movie_path not in taggarr_movies["movies"]
-        changed = current_mtime > saved_mtime
+        if result is not None:
+            movie_id, tag = result
+            # Stage tags for the bulk update after the scan
+            tag_groups.setdefault(tag, []).append(movie_id)
 
-        if write_mode == 0 and not (changed or is_new):
-            logger.info(f"Skipping {movie_folder} - no changes")
-            continue
+    # Apply tags to Radarr, one request per tag group
+    _apply_tags(client, tag_groups, instance, dry_run)
 
-        # Get Radarr metadata
-        movie_meta = client.get_movie_by_path(movie_path)
-        if not movie_meta:
-            logger.warning(f"No Radarr metadata for {movie_folder}")
-            continue
+    return taggarr_movies
 
-        # Skip movies not yet downloaded
-        if not movie_meta.get("hasFile", False):
-            logger.debug(f"Skipping {movie_folder} - not yet downloaded")
-            continue
 
-        # Genre filter
-        if instance.target_genre:
-            genres = [g.lower() for g in movie_meta.get("genres", [])]
-            if instance.target_genre.lower() not in genres:
-                logger.info(f"Skipping {movie_folder}: genre mismatch")
-                continue
+def _process_movie(client: RadarrClient, instance: InstanceConfig, movie_folder: str,
+                   movie_path: str, taggarr_movies: dict, language_codes: set,
+                   target_genre: Optional[str], dry_run: bool, write_mode: int,
+                   scanned_at: str) -> Optional[Tuple[int, Optional[str]]]:
+    """Scan a single movie and update its taggarr.json entry.
+
+    Returns None when the movie is skipped, otherwise ``(movie_id, tag)``.
+    """
+    saved = taggarr_movies["movies"].get(movie_path, {})
+    saved_mtime = saved.get("last_modified", 0)
+
+    # Get current mtime
+    try:
+        current_mtime = max(
+            os.path.getmtime(os.path.join(root, f))
+            for root, dirs, files in os.walk(movie_path)
+            for f in files if f.endswith(('.mkv', '.mp4', '.m4v', '.avi'))
+        )
+    except ValueError:
+        current_mtime = 0
+
+    is_new = movie_path not in taggarr_movies["movies"]
+    changed = current_mtime > saved_mtime
+
+    if write_mode == 0 and not (changed or is_new):
+        logger.info(f"Skipping {movie_folder} - no changes")
+        return None
 
-        logger.info(f"Processing movie: {movie_folder}")
+    # Get Radarr metadata
+    movie_meta = client.get_movie_by_path(movie_path)
+    if not movie_meta:
+        logger.warning(f"No Radarr metadata for {movie_folder}")
+        return None
 
-        movie_id = movie_meta.get("id")
-        if not movie_id:
-            logger.warning(f"No Radarr ID for {movie_folder}")
-            continue
+    # Skip movies not yet downloaded
+    if not movie_meta.get("hasFile", False):
+        logger.debug(f"Skipping {movie_folder} - not yet downloaded")
+        return None
 
-        # Handle remove mode
-        if write_mode == 2:
-            logger.info(f"Removing tags for {movie_folder}")
-            for tag in [instance.tags.dub, instance.tags.wrong]:
-                client.remove_tag(movie_id, tag, dry_run)
-            if movie_path in taggarr_movies["movies"]:
-                del taggarr_movies["movies"][movie_path]
-            continue
+    # Genre filter
+    if target_genre:
+        if not any(g.lower() == target_genre for g in movie_meta.get("genres", [])):
+            logger.info(f"Skipping {movie_folder}: genre mismatch")
+            return None
 
-        # Scan movie
-        scan_result = _scan_movie(movie_path, movie_meta, instance, language_codes)
-        if scan_result is None:
-            continue
+    logger.info(f"Processing movie: {movie_folder}")
 
-        # Determine tag
-        tag = _determine_tag(scan_result, instance, language_codes)
-        logger.info(f"Tagged as {tag or 'no tag (original)'}")
+    movie_id = movie_meta.get("id")
+    if not movie_id:
+        logger.warning(f"No Radarr ID for {movie_folder}")
+        return None
 
-        # Apply tags to Radarr
-        if tag:
-            client.add_tag(movie_id, tag, dry_run)
-            if tag == instance.tags.wrong:
-                client.remove_tag(movie_id, instance.tags.dub, dry_run)
-            elif tag == instance.tags.dub:
-                client.remove_tag(movie_id, instance.tags.wrong, dry_run)
-        else:
-            for t in [instance.tags.dub, instance.tags.wrong]:
-                client.remove_tag(movie_id, t, dry_run)
-
-        # Update NFO if applicable
-        nfo_path = _find_nfo(movie_path, movie_folder)
-        if nfo_path and tag in [instance.tags.dub, instance.tags.wrong]:
-            nfo.update_movie_tag(nfo_path, tag, dry_run)
-
-        # Save state
-        taggarr_movies["movies"][movie_path] = {
-            "display_name": movie_folder,
-            "tag": tag or "none",
-            "last_scan": datetime.utcnow().isoformat() + "Z",
-            "original_language": scan_result["original_language"],
-            "languages": scan_result["languages"],
-            "last_modified": current_mtime,
-        }
+    # Handle remove mode
+    if write_mode == 2:
+        logger.info(f"Removing tags for {movie_folder}")
+        if movie_path in taggarr_movies["movies"]:
+            del taggarr_movies["movies"][movie_path]
+        return movie_id, None
 
-    return taggarr_movies
+    # Scan movie
+    scan_result = _scan_movie(movie_path, movie_meta, instance, language_codes)
+    if scan_result is None:
+        return None
+
+    # Determine tag
+    tag = _determine_tag(scan_result, instance, language_codes)
+    logger.info(f"Tagged as {tag or 'no tag (original)'}")
+
+    # Update NFO if applicable
+    nfo_path = _find_nfo(movie_path, movie_folder)
+    if nfo_path and tag in [instance.tags.dub, instance.tags.wrong]:
+        nfo.update_movie_tag(nfo_path, tag, dry_run)
+
+    # Save state
+    taggarr_movies["movies"][movie_path] = {
+        "display_name": movie_folder,
+        "tag": tag or "none",
+        "last_scan": scanned_at,
+        "original_language": scan_result["original_language"],
+        "languages": scan_result["languages"],
+        "last_modified": current_mtime,
+    }
+    return movie_id, tag
+
+
+def _apply_tags(client: RadarrClient, tag_groups: Dict[Optional[str], List[int]],
+                instance: InstanceConfig, dry_run: bool) -> None:
+    """Apply staged tags in bulk and remove the conflicting ones."""
+    managed = [instance.tags.dub, instance.tags.wrong]
+    for tag, movie_ids in tag_groups.items():
+        if tag:
+            client.bulk_edit_tags(movie_ids, [tag], "add", dry_run)
+        client.bulk_edit_tags(movie_ids, [t for t in managed if t != tag], "remove", dry_run)
 
 
 def _scan_movie(movie_path: str, movie_meta: dict, instance: InstanceConfig,
                 language_codes: set) -> Optional[Dict]:
     """Scan a movie folder and return language analysis."""
-    video_exts = ['.mkv', '.mp4', '.m4v', '.avi', '.webm', '.mov', '.mxf']
-    ignore_patterns = ['-sample', 'sample.', 'extras', 'featurettes', 'behind the scenes', 'deleted scenes']
-
-    # Find all video files
-    video_files = []
-    for root, dirs, files in os.walk(movie_path):
-        dirs[:] = [d for d in dirs if not any(p in d.lower() for p in ignore_patterns)]
-        for f in files:
-            if os.path.splitext(f)[1].lower() in video_exts:
-                if any(p in f.lower() for p in ignore_patterns):
-                    continue
-                full_path = os.path.join(root, f)
-                video_files.append((full_path, os.path.getsize(full_path)))
-
+    video_files = _find_video_files(movie_path)
     if not video_files:
         logger.warning(f"No video files found in {movie_path}")
         return None
@@ -169,6 +187,27 @@ def _scan_movie(movie_path: str, movie_meta: dict, instance: InstanceConfig,
     }
 
 
+def _find_video_files(path: str) -> List[Tuple[str, int]]:
+    """Recursively collect (path, size) of video files, skipping samples and extras."""
+    video_files = []
+    try:
+        it = os.scandir(path)
+    except OSError as e:
+        # Unreadable folders are skipped, as os.walk did
+        logger.debug(f"Skipping unreadable folder {path}: {e}")
+        return video_files
+    with it:
+        for entry in it:
+            name = entry.name.lower()
+            if any(p in name for p in IGNORE_PATTERNS):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                video_files.extend(_find_video_files(entry.path))
+            elif name.endswith(media.VIDEO_EXTENSIONS):
+                video_files.append((entry.path, entry.stat().st_size))
+    return video_files
+
+
 def _determine_tag(scan_result: dict, instance: InstanceConfig,
                    language_codes: set) -> Optional[str]:
     """Determine the appropriate tag for a movie."""
@@ -189,12 +228,10 @@ def _determine_tag(scan_result: dict, instance: InstanceConfig,
         langs_aliases.update(languages.get_aliases(lang))
 
     # Check for all target languages
-    has_all_targets = True
-    for target in instance.target_languages:
-        target_aliases = languages.get_aliases(target)
-        if not langs_aliases.intersection(target_aliases):
-            has_all_targets = False
-            break
+    has_all_targets = not any(
+        langs_aliases.isdisjoint(languages.get_aliases(target))
+        for target in instance.target_languages
+    )
 
     # Check for unexpected languages
     unexpected = []
@@ -3,16 +3,19 @@
 import os
 import re
 import logging
-from datetime import datetime
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from taggarr.config_schema import InstanceConfig
 from taggarr.services.sonarr import SonarrClient
 from taggarr.services import media
+from taggarr.storage import json_store
 from taggarr import nfo, languages
 
 logger = logging.getLogger("taggarr")
 
+_EPISODE_RE = re.compile(r'(E\d{2})', re.IGNORECASE)
+
 
 def process_all(client: SonarrClient, instance: InstanceConfig, opts, taggarr_data: dict) -> dict:
     """Process all TV shows for a Sonarr instance."""
@@ -21,100 +24,183 @@ def process_all(client: SonarrClient, instance: InstanceConfig, opts, taggarr_da
     write_mode = opts.write_mode
 
     language_codes = languages.build_language_codes(instance.target_languages)
+    target_genre = instance.target_genre.lower() if instance.target_genre else None
+    scanned_at = json_store.scan_time()
+    tag_groups: Dict[Optional[str], List[int]] = {}
+    to_refresh: List[int] = []
+
+    # Entries of an absolute root already carry normalized absolute paths
+    with os.scandir(os.path.abspath(instance.root_path)) as it:
+        shows = sorted((e.name, e.path) for e in it if e.is_dir())
+
+    def process(show):
+        show_folder, show_path = show
+        # One bad folder must not drop the tags staged for the rest
+        try:
+            return _process_show(
+                client, instance, show_folder, show_path, taggarr_data["series"],
+                language_codes, target_genre, quick, dry_run, write_mode, scanned_at,
+            )
+        except Exception as e:
+            logger.error(f"Failed to process show {show_folder}: {e}")
+            return None
+
+    # Shows are I/O bound and independent; state is merged after the join.
+    # Seasons and episodes stay serial, so scan_workers bounds the total probes.
+    workers = min(max(1, instance.scan_workers), len(shows))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(process, shows))
+    else:
+        results = [process(s) for s in shows]
 
-    for show_folder in sorted(os.listdir(instance.root_path)):
-        show_path = os.path.abspath(os.path.join(instance.root_path, show_folder))
-        if not os.path.isdir(show_path):
+    for (show_folder, show_path), result in zip(shows, results):
+        if result is None:
             continue
+        series_id, tag, entry = result
 
-        saved_data = taggarr_data["series"].get(show_path, {})
-        saved_seasons = saved_data.get("seasons", {})
-
-        # Check if scan needed
-        is_new = show_path not in taggarr_data["series"]
-        changed = _has_changes(show_path, saved_seasons)
-        new_seasons = _has_new_seasons(show_path, saved_seasons)
+        # Stage tags for the bulk update after the scan
+        tag_groups.setdefault(tag, []).append(series_id)
 
-        if write_mode == 0 and not (changed or is_new or new_seasons):
-            logger.info(f"Skipping {show_folder} - no new or updated seasons")
+        if entry is None:
+            taggarr_data["series"].pop(show_path, None)
             continue
 
-        # Genre filter via NFO
-        nfo_path = os.path.join(show_path, "tvshow.nfo")
-        if not os.path.exists(nfo_path):
-            logger.debug(f"No NFO found for: {show_folder}")
-            continue
+        taggarr_data["series"][show_path] = entry
 
-        if not _passes_genre_filter(nfo_path, instance.target_genre):
-            logger.info(f"Skipping {show_folder}: genre mismatch")
-            continue
+        # Refresh if in rewrite mode
+        if write_mode == 1:
+            to_refresh.append(series_id)
 
-        logger.info(f"Processing show: {show_folder}")
+    # Apply tags to Sonarr, one request per tag group
+    _apply_tags(client, tag_groups, instance, dry_run)
+    for series_id in to_refresh:
+        client.refresh_series(series_id, dry_run)
 
-        # Get Sonarr metadata
-        series = client.get_series_by_path(show_path)
-        if not series:
-            logger.warning(f"No Sonarr metadata for {show_folder}")
-            continue
+    return taggarr_data
 
-        series_id = series['id']
 
-        # Handle remove mode
-        if write_mode == 2:
-            logger.info(f"Removing tags for {show_folder}")
-            for tag in [instance.tags.dub, instance.tags.semi, instance.tags.wrong]:
-                client.remove_tag(series_id, tag, dry_run)
-            if show_path in taggarr_data["series"]:
-                del taggarr_data["series"][show_path]
-            continue
+def _process_show(client: SonarrClient, instance: InstanceConfig, show_folder: str,
+                  show_path: str, saved_series: dict, language_codes: set,
+                  target_genre: Optional[str], quick: bool, dry_run: bool, write_mode: int,
+                  scanned_at: str) -> Optional[Tuple[int, Optional[str], Optional[dict]]]:
+    """Scan a single show.
+
+    Returns None when the show is skipped, otherwise ``(series_id, tag, entry)``
+    where ``entry`` is None if the show should be dropped from taggarr.json.
+    """
+    saved_data = saved_series.get(show_path, {})
+    saved_seasons = saved_data.get("seasons", {})
+
+    # Check if scan needed
+    season_mtimes = _list_seasons(show_path)
+    is_new = show_path not in saved_series
+    changed = _has_changes(season_mtimes, saved_seasons)
+    new_seasons = _has_new_seasons(season_mtimes, saved_seasons)
+
+    if write_mode == 0 and not (changed or is_new or new_seasons):
+        logger.info(f"Skipping {show_folder} - no new or updated seasons")
+        return None
+
+    # Genre filter via NFO
+    nfo_path = os.path.join(show_path, "tvshow.nfo")
+    try:
+        nfo_mtime = os.path.getmtime(nfo_path)
+    except OSError:
+        logger.debug(f"No NFO found for: {show_folder}")
+        return None
+
+    # A show saved with this NFO mtime already passed the same genre filter
+    nfo_root = None
+    if (write_mode == 0 and saved_data.get("nfo_mtime") == nfo_mtime
+            and saved_data.get("target_genre") == target_genre):
+        logger.debug(f"NFO unchanged for {show_folder} - reusing genre filter result")
+    else:
+        # Parse once; the tree is reused for the NFO tag update below
+        nfo_root = nfo.load(nfo_path) if target_genre else None
+        if not _passes_genre_filter(nfo_path, target_genre, nfo_root):
+            logger.info(f"Skipping {show_folder}: genre mismatch")
+            return None
 
-        # Scan and determine tag
-        tag, seasons = _scan_show(
-            show_path, series, instance, language_codes, quick
-        )
-        logger.info(f"Tagged as {tag or 'no tag (original)'}")
+    logger.info(f"Processing show: {show_folder}")
 
-        # Apply tags to Sonarr
-        _apply_tags(client, series_id, tag, instance, dry_run)
+    # Get Sonarr metadata
+    series = client.get_series_by_path(show_path)
+    if not series:
+        logger.warning(f"No Sonarr metadata for {show_folder}")
+        return None
 
-        # Update NFO tag
-        if tag in [instance.tags.dub, instance.tags.semi, instance.tags.wrong]:
-            nfo.update_tag(nfo_path, tag, dry_run)
+    series_id = series['id']
 
-        # Get current mtime for storage
-        current_mtime = 0
-        for d in os.listdir(show_path):
-            season_path = os.path.join(show_path, d)
-            if os.path.isdir(season_path) and d.lower().startswith("season"):
-                current_mtime = max(current_mtime, os.path.getmtime(season_path))
+    # Handle remove mode
+    if write_mode == 2:
+        logger.info(f"Removing tags for {show_folder}")
+        return series_id, None, None
 
-        # Save state
-        taggarr_data["series"][show_path] = _build_entry(
-            show_folder, tag, seasons, series, current_mtime
-        )
+    # Scan and determine tag
+    tag, seasons = _scan_show(
+        show_path, series, instance, language_codes, quick,
+        saved_seasons=saved_seasons if write_mode == 0 else None,
+        season_mtimes=season_mtimes,
+    )
+    logger.info(f"Tagged as {tag or 'no tag (original)'} for {show_folder}")
 
-        # Refresh if in rewrite mode
-        if write_mode == 1:
-            client.refresh_series(series_id, dry_run)
+    # Update NFO tag
+    if tag in [instance.tags.dub, instance.tags.semi, instance.tags.wrong]:
+        nfo.update_tag(nfo_path, tag, dry_run, root=nfo_root)
+        # Our own write must not look like an NFO change on the next run
+        nfo_mtime = os.path.getmtime(nfo_path)
 
-    return taggarr_data
+    # Get current mtime for storage
+    current_mtime = max(season_mtimes.values(), default=0)
+
+    entry = _build_entry(show_folder, tag, seasons, series, current_mtime, scanned_at)
+    entry["nfo_mtime"] = nfo_mtime
+    entry["target_genre"] = target_genre
+    return series_id, tag, entry
 
 
 def _scan_show(show_path: str, series_meta: dict, instance: InstanceConfig,
-               language_codes: set, quick: bool = False) -> Tuple[Optional[str], dict]:
-    """Scan all seasons and determine overall tag."""
+               language_codes: set, quick: bool = False,
+               saved_seasons: Optional[dict] = None,
+               season_mtimes: Optional[Dict[str, float]] = None) -> Tuple[Optional[str], dict]:
+    """Scan all seasons and determine overall tag.
+
+    Seasons whose folder mtime matches the entry in saved_seasons reuse the
+    stored stats instead of being re-analyzed. season_mtimes is the listing
+    from _list_seasons, if the caller already has one.
+    """
+    saved_seasons = saved_seasons or {}
     seasons = {}
     has_wrong, has_dub = False, False
+    # Shows are scanned concurrently, so log lines must name their show
+    show_folder = os.path.basename(show_path)
 
-    for entry in sorted(os.listdir(show_path)):
-        season_path = os.path.join(show_path, entry)
-        if not (os.path.isdir(season_path) and entry.lower().startswith("season")):
-            continue
+    # Language sets are invariant across seasons, so resolve them once per show
+    original = _original_language(series_meta)
+    original_codes = languages.get_aliases(original)
+    target_aliases = {t: languages.get_aliases(t) for t in sorted(instance.target_languages)}
+    # Saved stats are only valid for the languages they were computed against
+    fingerprint = f"{','.join(target_aliases)}|{original}"
+
+    if season_mtimes is None:
+        season_mtimes = _list_seasons(show_path)
+    season_dirs = sorted(season_mtimes)
 
-        logger.info(f"Scanning season: {entry}")
-        stats = _scan_season(season_path, series_meta, instance, language_codes, quick)
-        stats["last_modified"] = os.path.getmtime(season_path)
-        stats["status"] = _determine_status(stats)
+    for entry in season_dirs:
+        season_path = os.path.join(show_path, entry)
+        mtime = season_mtimes[entry]
+        stats = saved_seasons.get(entry)
+        if _can_reuse(stats, mtime, quick, fingerprint):
+            logger.debug(f"Reusing cached stats for unchanged season: {entry} of {show_folder}")
+        else:
+            logger.info(f"Scanning season: {entry} of {show_folder}")
+            stats = _scan_season(season_path, language_codes, original_codes, target_aliases, quick)
+            stats["last_modified"] = mtime
+            stats["status"] = _determine_status(stats)
+            stats["fingerprint"] = fingerprint
+            if quick:
+                stats["quick"] = True
 
         has_wrong = has_wrong or bool(stats["unexpected_languages"])
         has_dub = has_dub or bool(stats["dub"])
@@ -132,25 +218,38 @@ def _scan_show(show_path: str, series_meta: dict, instance: InstanceConfig,
     return None, seasons
 
 
-def _scan_season(season_path: str, series_meta: dict, instance: InstanceConfig,
-                 language_codes: set, quick: bool = False) -> dict:
-    """Scan episodes in a season folder."""
-    video_exts = ['.mkv', '.mp4', '.m4v', '.avi', '.webm', '.mov', '.mxf']
-    files = sorted([
-        f for f in os.listdir(season_path)
-        if os.path.splitext(f)[1].lower() in video_exts
-    ])
-    if quick and files:
-        files = [files[0]]
-
-    # Get original language codes
-    original_lang = series_meta.get("originalLanguage", "")
-    if isinstance(original_lang, dict):
-        original_lang_name = original_lang.get("name", "").lower()
-    else:
-        original_lang_name = str(original_lang).lower()
-
-    original_codes = languages.get_aliases(original_lang_name)
+def _can_reuse(saved: Optional[dict], mtime: float, quick: bool,
+               fingerprint: str) -> bool:
+    """Check whether saved season stats are still valid for this scan.
+
+    Stats are keyed by folder mtime and by the fingerprint of the target and
+    original languages they were computed against; stats from a quick scan
+    are not reused for a full scan.
+    """
+    if not saved or saved.get("last_modified") != mtime:
+        return False
+    if saved.get("fingerprint") != fingerprint:
+        return False
+    return quick or not saved.get("quick", False)
+
+
+def _scan_season(season_path: str, language_codes: set, original_codes: frozenset,
+                 target_aliases: Dict[str, frozenset], quick: bool = False) -> dict:
+    """Scan episodes in a season folder.
+
+    target_aliases maps each target language to its precomputed aliases.
+    """
+    show_folder = os.path.basename(os.path.dirname(season_path))
+    with os.scandir(season_path) as it:
+        names = (
+            e.name for e in it
+            if e.name.lower().endswith(media.VIDEO_EXTENSIONS) and e.is_file()
+        )
+        if quick:
+            first = min(names, default=None)
+            files = [first] if first else []
+        else:
+            files = sorted(names)
 
     stats = {
         "episodes": len(files) if not quick else 1,
@@ -164,38 +263,33 @@ def _scan_season(season_path: str, series_meta: dict, instance: InstanceConfig,
         full_path = os.path.join(season_path, f)
         langs = media.analyze_audio(full_path)
 
-        match = re.search(r'(E\d{2})', f, re.IGNORECASE)
+        match = _EPISODE_RE.search(f)
         ep_name = match.group(1) if match else os.path.splitext(f)[0]
 
         # Handle fallback audio track
         if "__fallback_original__" in langs:
             stats["original_dub"].append(ep_name)
-            logger.info(f"Audio track not labelled for {ep_name} — assuming original language")
+            logger.info(f"Audio track not labelled for {ep_name} of {show_folder} — assuming original language")
             continue
 
         langs_set = set(langs)
-        has_target = langs_set.intersection(language_codes)
 
         # Build aliases for detected languages
         langs_aliases = set()
         for lang in langs:
             langs_aliases.update(languages.get_aliases(lang))
 
-        # Check for missing target languages
-        missing_target = set()
-        for t in instance.target_languages:
-            t_aliases = languages.get_aliases(t)
-            if not langs_aliases.intersection(t_aliases):
-                missing_target.add(t)
-
-        has_original = langs_set.intersection(original_codes)
+        # Check for missing target languages (target_aliases is already sorted)
+        missing_target = [t for t, t_aliases in target_aliases.items()
+                          if langs_aliases.isdisjoint(t_aliases)]
 
-        if has_original:
+        if not langs_set.isdisjoint(original_codes):
             stats["original_dub"].append(ep_name)
-        if has_target:
-            stats["dub"].append(f"{ep_name}:{', '.join(sorted(has_target))}")
+        if not langs_set.isdisjoint(language_codes):
+            has_target = sorted(langs_set & language_codes)
+            stats["dub"].append(f"{ep_name}:{', '.join(has_target)}")
         if missing_target:
-            short_missing = [languages.get_primary_code(m) for m in sorted(missing_target)]
+            short_missing = [languages.get_primary_code(m) for m in missing_target]
             stats["missing_dub"].append(f"{ep_name}:{', '.join(short_missing)}")
 
         # Collect unexpected languages
@@ -207,54 +301,60 @@ def _scan_season(season_path: str, series_meta: dict, instance: InstanceConfig,
     return stats
 
 
-def _has_changes(show_path: str, saved_seasons: dict) -> bool:
+def _original_language(series_meta: dict) -> str:
+    """Extract the lowercased original language name from Sonarr metadata."""
+    original_lang = series_meta.get("originalLanguage", "")
+    if isinstance(original_lang, dict):
+        return original_lang.get("name", "").lower()
+    return str(original_lang).lower()
+
+
+def _list_seasons(show_path: str) -> Dict[str, float]:
+    """Map each season folder in a show to its mtime, from a single directory read."""
+    with os.scandir(show_path) as it:
+        return {
+            e.name: e.stat().st_mtime for e in it
+            if e.name.lower().startswith("season") and e.is_dir()
+        }
+
+
+def _has_changes(season_mtimes: Dict[str, float], saved_seasons: dict) -> bool:
     """Check if any season has been modified."""
-    for d in os.listdir(show_path):
-        season_path = os.path.join(show_path, d)
-        if os.path.isdir(season_path) and d.lower().startswith("season"):
-            current_mtime = os.path.getmtime(season_path)
-            saved_mtime = saved_seasons.get(d, {}).get("last_modified", 0)
-            if current_mtime > saved_mtime:
-                return True
-    return False
+    return any(
+        mtime > saved_seasons.get(d, {}).get("last_modified", 0)
+        for d, mtime in season_mtimes.items()
+    )
 
 
-def _has_new_seasons(show_path: str, saved_seasons: dict) -> bool:
+def _has_new_seasons(season_mtimes: Dict[str, float], saved_seasons: dict) -> bool:
     """Check if there are new season folders."""
-    existing = set(saved_seasons.keys())
-    current = set(
-        d for d in os.listdir(show_path)
-        if os.path.isdir(os.path.join(show_path, d)) and d.lower().startswith("season")
-    )
-    return len(current - existing) > 0
+    return not season_mtimes.keys() <= saved_seasons.keys()
+
 
+def _passes_genre_filter(nfo_path: str, target_genre: Optional[str],
+                         root=None) -> bool:
+    """Check if show passes genre filter.
 
-def _passes_genre_filter(nfo_path: str, target_genre: Optional[str]) -> bool:
-    """Check if show passes genre filter."""
+    target_genre is expected in lowercase, as process_all prepares it.
+    """
     if not target_genre:
         return True
-    genres = nfo.get_genres(nfo_path)
-    return target_genre.lower() in genres
+    return target_genre in nfo.get_genres(nfo_path, root)
 
 
-def _apply_tags(client: SonarrClient, series_id: int, tag: Optional[str],
+def _apply_tags(client: SonarrClient, tag_groups: Dict[Optional[str], List[int]],
                 instance: InstanceConfig, dry_run: bool) -> None:
-    """Apply appropriate tags and remove conflicting ones."""
-    if tag:
-        client.add_tag(series_id, tag, dry_run)
-        if tag == instance.tags.wrong:
-            client.remove_tag(series_id, instance.tags.semi, dry_run)
-            client.remove_tag(series_id, instance.tags.dub, dry_run)
-        elif tag == instance.tags.semi:
-            client.remove_tag(series_id, instance.tags.wrong, dry_run)
-            client.remove_tag(series_id, instance.tags.dub, dry_run)
-        elif tag == instance.tags.dub:
-            client.remove_tag(series_id, instance.tags.wrong, dry_run)
-            client.remove_tag(series_id, instance.tags.semi, dry_run)
-    else:
-        logger.info("Removing all tags since it's original (no tag)")
-        for t in [instance.tags.dub, instance.tags.semi, instance.tags.wrong]:
-            client.remove_tag(series_id, t, dry_run)
+    """Apply staged tags in bulk and remove the conflicting ones.
+
+    ``tag_groups`` maps each tag (``None`` for untagged) to its series IDs.
+    """
+    managed = [instance.tags.dub, instance.tags.semi, instance.tags.wrong]
+    for tag, series_ids in tag_groups.items():
+        if tag:
+            client.bulk_edit_tags(series_ids, [tag], "add", dry_run)
+        else:
+            logger.info(f"Removing all tags from {len(series_ids)} series with no tag")
+        client.bulk_edit_tags(series_ids, [t for t in managed if t != tag], "remove", dry_run)
 
 
 def _determine_status(stats: dict) -> str:
@@ -269,19 +369,14 @@ def _determine_status(stats: dict) -> str:
 
 
 def _build_entry(show_folder: str, tag: Optional[str], seasons: dict,
-                 series: dict, mtime: float) -> dict:
+                 series: dict, mtime: float, scanned_at: Optional[str] = None) -> dict:
     """Build taggarr.json entry for a show."""
-    original_lang = series.get("originalLanguage", "")
-    if isinstance(original_lang, dict):
-        original_lang = original_lang.get("name", "").lower()
-    else:
-        original_lang = str(original_lang).lower()
-
     return {
         "display_name": show_folder,
         "tag": tag or "none",
-        "last_scan": datetime.utcnow().isoformat() + "Z",
-        "original_language": original_lang,
+        "last_scan": scanned_at or json_store.scan_time(),
+        "original_language": _original_language(series),
         "seasons": seasons,
         "last_modified": mtime,
     }
+
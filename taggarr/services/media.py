@@ -1,10 +1,18 @@
 """Media file analysis using pymediainfo."""
 
 import logging
+
 from pymediainfo import MediaInfo
 
 logger = logging.getLogger("taggarr")
 
+VIDEO_EXTENSIONS = ('.mkv', '.mp4', '.m4v', '.avi', '.webm', '.mov', '.mxf')
+# Audio track languages live in the container header, so a shallow parse is enough
+PARSE_SPEED = 0.1
+# One record per audio track: language and title split by unit/record separators,
+# which can't appear in language codes and are vanishingly rare in titles
+_AUDIO_INFORM = "Audio;%Language%\x1f%Title%\x1e"
+
 
 def analyze_audio(video_path):
     """Extract audio language codes from a video file.
@@ -13,20 +21,22 @@ def analyze_audio(video_path):
     Uses "__fallback_original__" when track has no language but appears to be main audio.
     """
     try:
-        media_info = MediaInfo.parse(video_path)
+        output = MediaInfo.parse(video_path, parse_speed=PARSE_SPEED, output=_AUDIO_INFORM)
         langs = set()
         fallback_detected = False
 
-        for track in media_info.tracks:
-            if track.track_type == "Audio":
-                lang = (track.language or "").strip().lower()
-                title = (track.title or "").strip().lower()
-
-                if lang:
-                    langs.add(lang)
-                elif "track 1" in title or "audio 1" in title or title == "":
-                    langs.add("__fallback_original__")
-                    fallback_detected = True
+        for record in output.split("\x1e"):
+            if not record:
+                continue
+            lang, _, title = record.partition("\x1f")
+            lang = lang.strip().lower()
+            title = title.strip().lower()
+
+            if lang:
+                langs.add(lang)
+            elif "track 1" in title or "audio 1" in title or title == "":
+                langs.add("__fallback_original__")
+                fallback_detected = True
 
         logger.debug(f"Analyzed {video_path}, found audio languages: {sorted(langs)}")
         if fallback_detected:
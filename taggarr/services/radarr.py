@@ -1,14 +1,22 @@
 """Radarr API client."""
 
 import os
-import time
 import logging
 from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger("taggarr")
 
+EDITOR_BATCH_SIZE = 250
+
 
 class RadarrClient:
     """Client for Radarr API."""
@@ -17,91 +25,138 @@ class RadarrClient:
         self.url = url.rstrip("/")
         self.api_key = api_key
         self._headers = {"X-Api-Key": self.api_key}
+        self._tag_cache: Optional[Dict[str, int]] = None
+        self._movie_cache: Optional[Dict[str, Dict]] = None
+        self._movies_by_id: Dict[int, Dict] = {}
+        self._session = self._build_session()
 
-    def get_movies(self) -> List[Dict]:
-        """Fetch all movies from Radarr API."""
-        try:
-            resp = requests.get(
-                f"{self.url}/api/v3/movie",
-                headers=self._headers
-            )
-            return resp.json()
-        except Exception as e:
-            logger.warning(f"Failed to fetch Radarr movies: {e}")
-            return []
+    def _build_session(self) -> requests.Session:
+        """Create a keep-alive session with pooled connections and retries."""
+        session = requests.Session()
+        session.headers.update(self._headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def get_movie_by_path(self, path: str) -> Optional[Dict]:
         """Find a specific movie by its folder path."""
-        try:
-            resp = requests.get(
-                f"{self.url}/api/v3/movie",
-                headers=self._headers
-            )
-            for m in resp.json():
-                if os.path.basename(m['path']) == os.path.basename(path):
-                    return m
-        except Exception as e:
-            logger.warning(f"Radarr lookup failed: {e}")
-        return None
+        movies = self._get_all_movies()
+        if movies is None:
+            return None
+        return movies.get(os.path.basename(path))
 
-    def add_tag(self, movie_id: int, tag: str, dry_run: bool = False) -> None:
-        """Add a tag to a movie."""
-        if dry_run:
-            logger.info(f"[Dry Run] Would add tag '{tag}' to movie {movie_id}")
-            return
-        tag_id = self._get_or_create_tag(tag)
-        self._modify_movie_tags(movie_id, tag_id, remove=False)
+    def _get_all_movies(self) -> Optional[Dict[str, Dict]]:
+        """Fetch the movie list once and index it by folder basename."""
+        if self._movie_cache is None:
+            try:
+                resp = self._session.get(f"{self.url}/api/v3/movie")
+                cache = {}
+                for m in _decode(resp):
+                    cache.setdefault(os.path.basename(m['path']), m)
+                    self._movies_by_id[m['id']] = m
+                self._movie_cache = cache
+            except Exception as e:
+                logger.warning(f"Radarr lookup failed: {e}")
+        return self._movie_cache
+
+    def bulk_edit_tags(self, movie_ids: List[int], tags: List[str], apply: str,
+                       dry_run: bool = False) -> None:
+        """Add or remove tags on many movies through the editor endpoint.
 
-    def remove_tag(self, movie_id: int, tag: str, dry_run: bool = False) -> None:
-        """Remove a tag from a movie."""
+        ``apply`` is ``"add"`` or ``"remove"``. Missing tags are created when
+        adding and skipped when removing. IDs are sent EDITOR_BATCH_SIZE at
+        a time so very large libraries don't produce one huge request.
+        """
+        if not movie_ids or not tags:
+            return
         if dry_run:
-            logger.info(f"[Dry Run] Would remove tag '{tag}' from movie {movie_id}")
+            logger.info(f"[Dry Run] Would {apply} tags {tags} on {len(movie_ids)} movies")
             return
-        tag_id = self._get_tag_id(tag)
-        if tag_id:
-            self._modify_movie_tags(movie_id, tag_id, remove=True)
+        try:
+            if apply == "add":
+                tag_ids = [self._get_or_create_tag(t) for t in tags]
+            else:
+                tag_ids = [i for i in map(self._get_tag_id, tags) if i is not None]
+            if not tag_ids:
+                return
+
+            # Only send IDs whose known tags actually differ from the target
+            movie_ids = [i for i in movie_ids if self._needs_tag_edit(i, tag_ids, apply)]
+            if not movie_ids:
+                logger.debug(f"All movies already up to date for {apply} of tag IDs {tag_ids}")
+                return
+
+            for start in range(0, len(movie_ids), EDITOR_BATCH_SIZE):
+                batch = movie_ids[start:start + EDITOR_BATCH_SIZE]
+                resp = self._session.put(
+                    f"{self.url}/api/v3/movie/editor",
+                    json={"movieIds": batch, "tags": tag_ids, "applyTags": apply},
+                )
+                logger.debug(f"Bulk {apply} of tag IDs {tag_ids} on {len(batch)} movies")
+                if resp.ok:
+                    for movie_id in batch:
+                        cached = self._movies_by_id.get(movie_id)
+                        if cached is not None:
+                            cached["tags"] = _merge_tags(cached["tags"], tag_ids, apply)
+        except Exception as e:
+            logger.warning(f"Failed to bulk edit movie tags: {e}")
+
+    def _needs_tag_edit(self, movie_id: int, tag_ids: List[int], apply: str) -> bool:
+        """Check the cached tags to see whether an editor call would change anything.
+
+        Items missing from the cache are always edited.
+        """
+        cached = self._movies_by_id.get(movie_id)
+        if cached is None:
+            return True
+        current = set(cached["tags"])
+        if apply == "add":
+            return not current.issuperset(tag_ids)
+        return not current.isdisjoint(tag_ids)
 
     def _get_tag_id(self, tag: str) -> Optional[int]:
-        """Get tag ID by label."""
-        try:
-            r = requests.get(
-                f"{self.url}/api/v3/tag",
-                headers=self._headers
-            )
-            for t in r.json():
-                if t["label"].lower() == tag.lower():
-                    return t["id"]
-        except Exception:
-            pass
-        return None
+        """Get tag ID by label.
+
+        The tag list is fetched once and cached for the lifetime of the client.
+        """
+        if self._tag_cache is None:
+            try:
+                r = self._session.get(f"{self.url}/api/v3/tag")
+                self._tag_cache = {t["label"].lower(): t["id"] for t in _decode(r)}
+            except Exception:
+                return None
+        return self._tag_cache.get(tag.lower())
 
     def _get_or_create_tag(self, tag: str) -> int:
         """Get existing tag ID or create new one."""
         tag_id = self._get_tag_id(tag)
         if tag_id is None:
-            r = requests.post(
-                f"{self.url}/api/v3/tag",
-                headers=self._headers,
-                json={"label": tag}
-            )
-            tag_id = r.json()["id"]
+            r = self._session.post(f"{self.url}/api/v3/tag", json={"label": tag})
+            tag_id = _decode(r)["id"]
+            if self._tag_cache is not None:
+                self._tag_cache[tag.lower()] = tag_id
             logger.debug(f"Created new Radarr tag '{tag}' with ID {tag_id}")
         return tag_id
 
-    def _modify_movie_tags(self, movie_id: int, tag_id: int, remove: bool = False) -> None:
-        """Add or remove a tag from movie."""
-        try:
-            m_url = f"{self.url}/api/v3/movie/{movie_id}"
-            m_data = requests.get(m_url, headers=self._headers).json()
-
-            if remove and tag_id in m_data["tags"]:
-                m_data["tags"].remove(tag_id)
-                logger.debug(f"Removing tag ID {tag_id} from movie {movie_id}")
-            elif not remove and tag_id not in m_data["tags"]:
-                m_data["tags"].append(tag_id)
-                logger.debug(f"Adding tag ID {tag_id} to movie {movie_id}")
-
-            requests.put(m_url, headers=self._headers, json=m_data)
-            time.sleep(0.5)
-        except Exception as e:
-            logger.warning(f"Failed to modify movie tags: {e}")
+
+def _merge_tags(current: List[int], tag_ids: List[int], apply: str) -> List[int]:
+    """Return ``current`` with ``tag_ids`` added or removed."""
+    if apply == "add":
+        return current + [t for t in tag_ids if t not in current]
+    return [t for t in current if t not in tag_ids]
+
+
+def _decode(resp: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
@@ -3,12 +3,26 @@
 import os
 import re
 import json
+import locale
+import hashlib
 import logging
+from datetime import datetime, timezone
 
 from taggarr import __version__
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger("taggarr")
 
+_INLINE_KEYS = frozenset({"original_dub", "dub", "missing_dub", "unexpected_languages", "languages"})
+_EPISODE_RE = re.compile(r'E\d{2}')
+
+# Digest of the last content loaded from or written to each taggarr.json path
+_saved_digests = {}
+
 
 def load(json_path, key="series"):
     """Load taggarr.json, returning empty dict if missing/corrupted."""
@@ -21,10 +35,12 @@ def load(json_path, key="series"):
 
     try:
         logger.info(f"taggarr.json found at {json_path}")
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-            logger.debug(f"Loaded taggarr.json with {len(data.get(key, {}))} entries.")
-            return data
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+        data = _loads(raw)
+        _saved_digests[json_path] = hashlib.blake2b(raw, digest_size=16).digest()
+        logger.debug(f"Loaded taggarr.json with {len(data.get(key, {}))} entries.")
+        return data
     except Exception as e:
         logger.warning(f"taggarr.json is corrupted: {e}")
         backup_path = json_path + ".bak"
@@ -33,41 +49,126 @@ def load(json_path, key="series"):
         return {key: {}}
 
 
-def save(json_path, data, key="series"):
-    """Save taggarr.json with compacted formatting."""
+def _loads(raw):
+    """Decode JSON bytes, using orjson when it is installed.
+
+    Files written by older versions used the locale encoding (e.g. cp1252 on
+    Windows), so undecodable UTF-8 is retried as locale text before the file
+    is treated as corrupted.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except ValueError:
+        return json.loads(raw.decode(locale.getpreferredencoding(False)))
+
+
+def save(json_path, data, key="series", dirty=None):
+    """Save taggarr.json with compacted formatting.
+
+    The document is written to a temporary file and swapped into place, so a
+    failed write never leaves a truncated taggarr.json behind.
+
+    ``dirty`` is the set of entry keys changed since load (see changed_keys).
+    When it is empty, nothing is serialised or written. When it is None, the
+    document is hashed first and not written if it matches what is on disk.
+    """
     if not json_path:
         return
 
+    if (dirty is not None and not dirty and json_path in _saved_digests
+            and data.get("version") == __version__ and os.path.exists(json_path)):
+        logger.debug("No taggarr.json entries changed — skipping write.")
+        return
+
+    tmp_path = json_path + ".tmp"
     try:
         data["version"] = __version__
         ordered = {"version": __version__}
         ordered.update({k: v for k, v in data.items() if k != "version"})
 
-        raw_json = json.dumps(ordered, indent=2, ensure_ascii=False)
-        compact_json = _compact_lists(raw_json)
+        chunks = (chunk.encode('utf-8') for chunk in _iter_json(ordered))
+        if dirty is None:
+            # No change tracking: hash the content before touching the disk
+            chunks = list(chunks)
+            digest = _digest(chunks)
+            if _saved_digests.get(json_path) == digest and os.path.exists(json_path):
+                logger.debug("taggarr.json unchanged — skipping write.")
+                return
 
-        with open(json_path, 'w') as f:
-            f.write(compact_json)
+        h = hashlib.blake2b(digest_size=16)
+        with open(tmp_path, 'wb') as f:
+            for chunk in chunks:
+                h.update(chunk)
+                f.write(chunk)
+        os.replace(tmp_path, json_path)
+        _saved_digests[json_path] = h.digest()
         logger.debug("taggarr.json saved successfully.")
     except Exception as e:
         logger.warning(f"Failed to save taggarr.json: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def scan_time():
+    """Current UTC time in the ISO format stored as last_scan."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def changed_keys(before, after):
+    """Return the entry keys added, replaced or removed between two snapshots.
+
+    Processors replace entries rather than mutating them, so an identity check
+    is enough to spot changes without comparing contents.
+    """
+    dirty = {k for k, v in after.items() if before.get(k) is not v}
+    dirty.update(before.keys() - after.keys())
+    return dirty
+
+
+def _digest(chunks):
+    """Hash encoded JSON chunks without joining them into one buffer."""
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        h.update(chunk)
+    return h.digest()
+
+
+def _iter_json(value, level=0, key=None):
+    """Yield JSON text with 2-space indentation.
+
+    Episode lists and the per-season language lists are emitted on a single
+    line; everything else is indented like json.dumps(indent=2).
+    """
+    if isinstance(value, dict):
+        if not value:
+            yield "{}"
+            return
+        inner = "  " * (level + 1)
+        yield "{\n"
+        for i, (k, v) in enumerate(value.items()):
+            if i:
+                yield ",\n"
+            yield f"{inner}{json.dumps(k, ensure_ascii=False)}: "
+            yield from _iter_json(v, level + 1, k)
+        yield "\n" + "  " * level + "}"
+    elif isinstance(value, list):
+        if not value or key in _INLINE_KEYS or _is_episode_list(value):
+            yield json.dumps(value, ensure_ascii=False)
+            return
+        inner = "  " * (level + 1)
+        yield "[\n"
+        for i, v in enumerate(value):
+            if i:
+                yield ",\n"
+            yield inner
+            yield from _iter_json(v, level + 1)
+        yield "\n" + "  " * level + "]"
+    else:
+        yield json.dumps(value, ensure_ascii=False)
 
 
-def _compact_lists(raw_json):
-    """Compact episode and language lists onto single lines."""
-    # Compact E## lists
-    result = re.sub(
-        r'(\[\s*\n\s*)((?:\s*"E\d{2}",?\s*\n?)+)(\s*\])',
-        lambda m: '[{}]'.format(', '.join(re.findall(r'"E\d{2}"', m.group(2)))),
-        raw_json
-    )
-    # Compact language lists
-    result = re.sub(
-        r'("(?:original_dub|dub|missing_dub|unexpected_languages|languages)": )\[\s*\n\s*((?:\s*"[^"]+",?\s*\n?)+)(\s*\])',
-        lambda m: '{}[{}]'.format(
-            m.group(1),
-            ', '.join(f'"{x}"' for x in re.findall(r'"([^"]+)"', m.group(2)))
-        ),
-        result
-    )
-    return result
+def _is_episode_list(value):
+    """Check whether a list holds only E## episode labels."""
+    return all(isinstance(v, str) and _EPISODE_RE.fullmatch(v) for v in value)
@@ -3,7 +3,7 @@
 import logging
 import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 from types import SimpleNamespace
 
 from taggarr.processors import movies
@@ -223,6 +223,43 @@ class TestScanMovie:
         # Should have scanned main movie, not extras
         assert result["file"] == "movie.mkv"
 
+    @patch("taggarr.processors.movies.media.analyze_audio")
+    def test_finds_video_in_subdirectory(self, mock_analyze, tmp_path, instance):
+        movie_path = tmp_path / "Movie"
+        subdir = movie_path / "CD1"
+        subdir.mkdir(parents=True)
+        (movie_path / "movie.nfo").write_text("<movie/>")
+        (subdir / "movie.mkv").write_bytes(b"x" * 1000)
+
+        mock_analyze.return_value = ["en"]
+        movie_meta = {"originalLanguage": "English"}
+
+        result = movies._scan_movie(str(movie_path), movie_meta, instance, {"en"})
+
+        assert result["file"] == "movie.mkv"
+
+    @patch("taggarr.processors.movies.media.analyze_audio")
+    def test_skips_unreadable_subdirectory(self, mock_analyze, tmp_path, instance):
+        movie_path = tmp_path / "Movie"
+        locked = movie_path / "@eaDir"
+        locked.mkdir(parents=True)
+        (movie_path / "movie.mkv").write_bytes(b"x" * 1000)
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if path == str(locked):
+                raise PermissionError("denied")
+            return real_scandir(path)
+
+        mock_analyze.return_value = ["en"]
+        movie_meta = {"originalLanguage": "English"}
+
+        with patch("taggarr.processors.movies.os.scandir", side_effect=scandir):
+            result = movies._scan_movie(str(movie_path), movie_meta, instance, {"en"})
+
+        assert result["file"] == "movie.mkv"
+
     @patch("taggarr.processors.movies.media.analyze_audio")
     def test_ignores_featurettes_in_filename(self, mock_analyze, tmp_path, instance):
         movie_path = tmp_path / "Movie"
@@ -269,6 +306,50 @@ class TestProcessAll:
 
         mock_scan.assert_not_called()
 
+    @patch("taggarr.processors.movies._apply_tags")
+    @patch("taggarr.processors.movies._determine_tag")
+    @patch("taggarr.processors.movies._scan_movie")
+    def test_failing_movie_keeps_other_tags(self, mock_scan, mock_tag, mock_apply, tmp_path, instance, caplog):
+        """An error in one movie is logged and the others are still tagged."""
+        instance.root_path = str(tmp_path)
+        for name in ["A Movie", "B Movie"]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "movie.mkv").write_bytes(b"x")
+
+        client = Mock()
+        client.get_movie_by_path.side_effect = [
+            PermissionError("denied"), {"id": 2, "hasFile": True},
+        ]
+        mock_scan.return_value = {"original_language": "english", "languages": ["en"]}
+        mock_tag.return_value = instance.tags.dub
+        opts = SimpleNamespace(quick=False, dry_run=False, write_mode=0)
+
+        result = movies.process_all(client, instance, opts, {"movies": {}})
+
+        assert "Failed to process movie A Movie: denied" in caplog.text
+        assert mock_apply.call_args[0][1] == {"dub": [2]}
+        assert list(result["movies"]) == [str(tmp_path / "B Movie")]
+
+    @patch("taggarr.processors.movies._apply_tags")
+    @patch("taggarr.processors.movies._determine_tag")
+    @patch("taggarr.processors.movies._scan_movie")
+    def test_stamps_movies_with_shared_scan_time(self, mock_scan, mock_tag, mock_apply, tmp_path, instance):
+        instance.root_path = str(tmp_path)
+        for name in ["A Movie", "B Movie"]:
+            (tmp_path / name).mkdir()
+
+        client = Mock()
+        client.get_movie_by_path.return_value = {"id": 1, "hasFile": True}
+        mock_scan.return_value = {"original_language": "english", "languages": ["en"]}
+        mock_tag.return_value = None
+        opts = SimpleNamespace(quick=False, dry_run=False, write_mode=0)
+
+        with patch("taggarr.processors.movies.json_store.scan_time", return_value="2025-06-26T19:22:11.769510Z") as mock_time:
+            result = movies.process_all(client, instance, opts, {"movies": {}})
+
+        mock_time.assert_called_once()
+        assert {m["last_scan"] for m in result["movies"].values()} == {"2025-06-26T19:22:11.769510Z"}
+
     @patch("taggarr.processors.movies._scan_movie")
     def test_skips_unchanged_movies(self, mock_scan, tmp_path, instance, caplog):
         caplog.set_level(logging.INFO)
@@ -392,7 +473,7 @@ class TestProcessAll:
 
         result = movies.process_all(client, instance, opts, taggarr_data)
 
-        assert client.remove_tag.call_count == 2
+        client.bulk_edit_tags.assert_called_once_with([42], ["dub", "wrong-dub"], "remove", False)
         # Should not fail even though movie wasn't in data
         assert str(movie_path) not in result["movies"]
 
@@ -429,7 +510,7 @@ class TestProcessAll:
 
         result = movies.process_all(client, instance, opts, taggarr_data)
 
-        assert client.remove_tag.call_count == 2
+        client.bulk_edit_tags.assert_called_once_with([42], ["dub", "wrong-dub"], "remove", False)
         assert str(movie_path) not in result["movies"]
 
     @patch("taggarr.processors.movies._scan_movie")
@@ -456,8 +537,10 @@ class TestProcessAll:
 
         result = movies.process_all(client, instance, opts, taggarr_data)
 
-        client.add_tag.assert_called_once_with(42, "dub", False)
-        client.remove_tag.assert_called_once_with(42, "wrong-dub", False)
+        client.bulk_edit_tags.assert_has_calls([
+            call([42], ["dub"], "add", False),
+            call([42], ["wrong-dub"], "remove", False),
+        ])
 
     @patch("taggarr.processors.movies._scan_movie")
     @patch("taggarr.processors.movies._determine_tag")
@@ -483,8 +566,40 @@ class TestProcessAll:
 
         movies.process_all(client, instance, opts, taggarr_data)
 
-        client.add_tag.assert_called_once_with(42, "wrong-dub", False)
-        client.remove_tag.assert_called_once_with(42, "dub", False)
+        client.bulk_edit_tags.assert_has_calls([
+            call([42], ["wrong-dub"], "add", False),
+            call([42], ["dub"], "remove", False),
+        ])
+
+    @patch("taggarr.processors.movies._scan_movie")
+    @patch("taggarr.processors.movies._determine_tag")
+    def test_groups_movies_into_one_request_per_tag(self, mock_tag, mock_scan, tmp_path, instance):
+        instance.root_path = str(tmp_path)
+        for name in ["A (2020)", "B (2021)"]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "movie.mkv").write_bytes(b"x" * 100)
+
+        mock_scan.return_value = {
+            "file": "movie.mkv",
+            "languages": ["en"],
+            "original_language": "japanese",
+            "original_codes": {"ja"},
+            "last_modified": 12345.0,
+        }
+        mock_tag.return_value = "dub"
+
+        client = Mock()
+        client.get_movie_by_path.side_effect = [
+            {"id": 1, "hasFile": True}, {"id": 2, "hasFile": True},
+        ]
+        opts = SimpleNamespace(quick=False, dry_run=False, write_mode=0)
+
+        movies.process_all(client, instance, opts, {"movies": {}})
+
+        assert client.bulk_edit_tags.call_args_list == [
+            call([1, 2], ["dub"], "add", False),
+            call([1, 2], ["wrong-dub"], "remove", False),
+        ]
 
     @patch("taggarr.processors.movies._scan_movie")
     @patch("taggarr.processors.movies._determine_tag")
@@ -510,8 +625,7 @@ class TestProcessAll:
 
         movies.process_all(client, instance, opts, taggarr_data)
 
-        client.add_tag.assert_not_called()
-        assert client.remove_tag.call_count == 2
+        client.bulk_edit_tags.assert_called_once_with([42], ["dub", "wrong-dub"], "remove", False)
 
     @patch("taggarr.processors.movies._scan_movie")
     def test_continues_when_scan_returns_none(self, mock_scan, tmp_path, instance):
@@ -529,7 +643,7 @@ class TestProcessAll:
 
         result = movies.process_all(client, instance, opts, taggarr_data)
 
-        client.add_tag.assert_not_called()
+        client.bulk_edit_tags.assert_not_called()
         assert str(movie_path) not in result["movies"]
 
     @patch("taggarr.processors.movies._scan_movie")
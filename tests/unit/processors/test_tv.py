@@ -2,10 +2,13 @@
 
 import logging
 import os
+import re
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import xml.etree.ElementTree as ET
+from unittest.mock import Mock, call, patch, MagicMock
 from types import SimpleNamespace
 
+from taggarr import languages
 from taggarr.processors import tv
 from taggarr.config_schema import InstanceConfig, TagsConfig
 
@@ -84,6 +87,13 @@ class TestPassesGenreFilter:
 
         assert result is True
 
+    def test_uses_parsed_root(self, tmp_path):
+        root = ET.fromstring("<tvshow><genre>Anime</genre></tvshow>")
+
+        result = tv._passes_genre_filter(str(tmp_path / "missing.nfo"), "anime", root)
+
+        assert result is True
+
     def test_returns_false_when_genre_not_found(self, tmp_path):
         nfo_path = tmp_path / "tvshow.nfo"
         nfo_path.write_text("<tvshow><genre>Drama</genre></tvshow>")
@@ -93,6 +103,22 @@ class TestPassesGenreFilter:
         assert result is False
 
 
+class TestListSeasons:
+    """Tests for _list_seasons function."""
+
+    def test_maps_season_dirs_to_mtime(self, tmp_path):
+        (tmp_path / "Season 01").mkdir()
+        (tmp_path / "season 02").mkdir()
+        (tmp_path / "Extras").mkdir()
+        (tmp_path / "Season 03.nfo").write_text("")
+        os.utime(tmp_path / "Season 01", (1000, 1000))
+
+        result = tv._list_seasons(str(tmp_path))
+
+        assert set(result) == {"Season 01", "season 02"}
+        assert result["Season 01"] == 1000
+
+
 class TestHasChanges:
     """Tests for _has_changes function."""
 
@@ -103,7 +129,7 @@ class TestHasChanges:
 
         saved_seasons = {"Season 01": {"last_modified": 0}}
 
-        result = tv._has_changes(str(show_path), saved_seasons)
+        result = tv._has_changes(tv._list_seasons(str(show_path)), saved_seasons)
 
         assert result is True
 
@@ -115,7 +141,7 @@ class TestHasChanges:
         current_mtime = os.path.getmtime(str(season_path))
         saved_seasons = {"Season 01": {"last_modified": current_mtime + 1}}
 
-        result = tv._has_changes(str(show_path), saved_seasons)
+        result = tv._has_changes(tv._list_seasons(str(show_path)), saved_seasons)
 
         assert result is False
 
@@ -127,7 +153,7 @@ class TestHasChanges:
         current_mtime = os.path.getmtime(str(show_path / "Season 01"))
         saved_seasons = {"Season 01": {"last_modified": current_mtime + 1}}
 
-        result = tv._has_changes(str(show_path), saved_seasons)
+        result = tv._has_changes(tv._list_seasons(str(show_path)), saved_seasons)
 
         assert result is False
 
@@ -142,7 +168,7 @@ class TestHasNewSeasons:
 
         saved_seasons = {"Season 01": {}}
 
-        result = tv._has_new_seasons(str(show_path), saved_seasons)
+        result = tv._has_new_seasons(tv._list_seasons(str(show_path)), saved_seasons)
 
         assert result is True
 
@@ -152,7 +178,7 @@ class TestHasNewSeasons:
 
         saved_seasons = {"Season 01": {}}
 
-        result = tv._has_new_seasons(str(show_path), saved_seasons)
+        result = tv._has_new_seasons(tv._list_seasons(str(show_path)), saved_seasons)
 
         assert result is False
 
@@ -163,7 +189,7 @@ class TestHasNewSeasons:
 
         saved_seasons = {"Season 01": {}}
 
-        result = tv._has_new_seasons(str(show_path), saved_seasons)
+        result = tv._has_new_seasons(tv._list_seasons(str(show_path)), saved_seasons)
 
         assert result is False
 
@@ -174,37 +200,52 @@ class TestApplyTags:
     def test_adds_dub_tag_and_removes_others(self, instance):
         client = Mock()
 
-        tv._apply_tags(client, 1, instance.tags.dub, instance, False)
+        tv._apply_tags(client, {instance.tags.dub: [1]}, instance, False)
 
-        client.add_tag.assert_called_once_with(1, "dub", False)
-        assert client.remove_tag.call_count == 2  # Removes wrong and semi
+        assert client.bulk_edit_tags.call_args_list == [
+            call([1], ["dub"], "add", False),
+            call([1], ["semi-dub", "wrong-dub"], "remove", False),
+        ]
 
     def test_adds_semi_tag_and_removes_others(self, instance):
         client = Mock()
 
-        tv._apply_tags(client, 1, instance.tags.semi, instance, False)
+        tv._apply_tags(client, {instance.tags.semi: [1]}, instance, False)
 
-        client.add_tag.assert_called_once_with(1, "semi-dub", False)
-        assert client.remove_tag.call_count == 2
+        assert client.bulk_edit_tags.call_args_list == [
+            call([1], ["semi-dub"], "add", False),
+            call([1], ["dub", "wrong-dub"], "remove", False),
+        ]
 
     def test_adds_wrong_tag_and_removes_others(self, instance):
         client = Mock()
 
-        tv._apply_tags(client, 1, instance.tags.wrong, instance, False)
+        tv._apply_tags(client, {instance.tags.wrong: [1]}, instance, False)
 
-        client.add_tag.assert_called_once_with(1, "wrong-dub", False)
-        assert client.remove_tag.call_count == 2
+        assert client.bulk_edit_tags.call_args_list == [
+            call([1], ["wrong-dub"], "add", False),
+            call([1], ["dub", "semi-dub"], "remove", False),
+        ]
 
     def test_removes_all_tags_when_no_tag(self, instance, caplog):
         caplog.set_level(logging.INFO)
         client = Mock()
 
-        tv._apply_tags(client, 1, None, instance, False)
+        tv._apply_tags(client, {None: [1]}, instance, False)
 
-        client.add_tag.assert_not_called()
-        assert client.remove_tag.call_count == 3
+        client.bulk_edit_tags.assert_called_once_with(
+            [1], ["dub", "semi-dub", "wrong-dub"], "remove", False
+        )
         assert "Removing all tags" in caplog.text
 
+    def test_one_request_pair_per_group(self, instance):
+        client = Mock()
+
+        tv._apply_tags(client, {"dub": [1, 2, 3], None: [4]}, instance, True)
+
+        assert client.bulk_edit_tags.call_count == 3
+        client.bulk_edit_tags.assert_any_call([1, 2, 3], ["dub"], "add", True)
+
 
 class TestBuildEntry:
     """Tests for _build_entry function."""
@@ -222,6 +263,16 @@ class TestBuildEntry:
         assert result["last_modified"] == 12345.0
         assert "last_scan" in result
 
+    def test_uses_given_scan_time(self):
+        result = tv._build_entry("Test", "dub", {}, {}, 0, "2025-06-26T19:22:11.769510Z")
+
+        assert result["last_scan"] == "2025-06-26T19:22:11.769510Z"
+
+    def test_default_scan_time_is_utc_iso(self):
+        result = tv._build_entry("Test", "dub", {}, {}, 0)
+
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}Z", result["last_scan"])
+
     def test_handles_string_original_language(self):
         series = {"originalLanguage": "English"}
 
@@ -244,112 +295,196 @@ class TestBuildEntry:
         assert result["original_language"] == ""
 
 
+JA_CODES = languages.get_aliases("japanese")
+EN_TARGETS = {"en": languages.get_aliases("en")}
+
+
 class TestScanSeason:
     """Tests for _scan_season function."""
 
     @patch("taggarr.processors.tv.media.analyze_audio")
-    def test_scans_video_files(self, mock_analyze, tmp_path, instance):
+    def test_scans_video_files(self, mock_analyze, tmp_path):
         season_path = tmp_path / "Season 01"
         season_path.mkdir()
         (season_path / "S01E01.mkv").write_bytes(b"x")
         (season_path / "S01E02.mkv").write_bytes(b"x")
 
         mock_analyze.return_value = ["en"]
-        series_meta = {"originalLanguage": {"name": "Japanese"}}
 
-        stats = tv._scan_season(str(season_path), series_meta, instance, {"en", "eng"})
+        stats = tv._scan_season(str(season_path), {"en", "eng"}, JA_CODES, EN_TARGETS)
 
         assert stats["episodes"] == 2
         assert mock_analyze.call_count == 2
 
     @patch("taggarr.processors.tv.media.analyze_audio")
-    def test_quick_mode_scans_only_first(self, mock_analyze, tmp_path, instance):
+    def test_quick_mode_scans_only_first(self, mock_analyze, tmp_path):
         season_path = tmp_path / "Season 01"
         season_path.mkdir()
         (season_path / "S01E01.mkv").write_bytes(b"x")
         (season_path / "S01E02.mkv").write_bytes(b"x")
 
         mock_analyze.return_value = ["en"]
-        series_meta = {"originalLanguage": "Japanese"}
 
-        stats = tv._scan_season(str(season_path), series_meta, instance, {"en"}, quick=True)
+        stats = tv._scan_season(str(season_path), {"en"}, JA_CODES, EN_TARGETS, quick=True)
 
         assert stats["episodes"] == 1
         assert mock_analyze.call_count == 1
 
     @patch("taggarr.processors.tv.media.analyze_audio")
-    def test_detects_fallback_original(self, mock_analyze, tmp_path, instance, caplog):
-        caplog.set_level(logging.INFO)
+    def test_quick_mode_picks_first_episode_by_name(self, mock_analyze, tmp_path):
         season_path = tmp_path / "Season 01"
         season_path.mkdir()
+        for name in ["S01E03.mkv", "S01E01.mkv", "S01E02.mkv"]:
+            (season_path / name).write_bytes(b"x")
+
+        mock_analyze.return_value = ["en"]
+
+        tv._scan_season(str(season_path), {"en"}, JA_CODES, EN_TARGETS, quick=True)
+
+        mock_analyze.assert_called_once_with(str(season_path / "S01E01.mkv"))
+
+    @patch("taggarr.processors.tv.media.analyze_audio")
+    def test_quick_mode_handles_empty_season(self, mock_analyze, tmp_path):
+        season_path = tmp_path / "Season 01"
+        season_path.mkdir()
+
+        stats = tv._scan_season(str(season_path), {"en"}, JA_CODES, EN_TARGETS, quick=True)
+
+        mock_analyze.assert_not_called()
+        assert stats["dub"] == []
+
+    @patch("taggarr.processors.tv.media.analyze_audio")
+    def test_detects_fallback_original(self, mock_analyze, tmp_path, caplog):
+        caplog.set_level(logging.INFO)
+        season_path = tmp_path / "Show" / "Season 01"
+        season_path.mkdir(parents=True)
         (season_path / "S01E01.mkv").write_bytes(b"x")
 
         mock_analyze.return_value = ["__fallback_original__"]
-        series_meta = {"originalLanguage": "Japanese"}
 
-        stats = tv._scan_season(str(season_path), series_meta, instance, {"en"})
+        stats = tv._scan_season(str(season_path), {"en"}, JA_CODES, EN_TARGETS)
 
         assert "E01" in stats["original_dub"]
-        assert "assuming original" in caplog.text
+        assert "not labelled for E01 of Show — assuming original" in caplog.text
 
     @patch("taggarr.processors.tv.media.analyze_audio")
-    def test_detects_target_language(self, mock_analyze, tmp_path, instance):
+    def test_detects_target_language(self, mock_analyze, tmp_path):
         season_path = tmp_path / "Season 01"
         season_path.mkdir()
         (season_path / "S01E01.mkv").write_bytes(b"x")
 
         mock_analyze.return_value = ["en", "ja"]
-        series_meta = {"originalLanguage": {"name": "Japanese"}}
 
-        stats = tv._scan_season(str(season_path), series_meta, instance, {"en", "eng"})
+        stats = tv._scan_season(str(season_path), {"en", "eng"}, JA_CODES, EN_TARGETS)
 
         assert len(stats["dub"]) == 1
         assert "E01" in stats["dub"][0]
 
     @patch("taggarr.processors.tv.media.analyze_audio")
-    def test_detects_unexpected_language(self, mock_analyze, tmp_path, instance):
+    def test_detects_unexpected_language(self, mock_analyze, tmp_path):
         season_path = tmp_path / "Season 01"
         season_path.mkdir()
         (season_path / "S01E01.mkv").write_bytes(b"x")
 
         mock_analyze.return_value = ["en", "de"]  # German is unexpected
-        series_meta = {"originalLanguage": {"name": "Japanese"}}
 
-        stats = tv._scan_season(str(season_path), series_meta, instance, {"en", "eng"})
+        stats = tv._scan_season(str(season_path), {"en", "eng"}, JA_CODES, EN_TARGETS)
 
         assert "de" in stats["unexpected_languages"]
 
     @patch("taggarr.processors.tv.media.analyze_audio")
-    def test_handles_missing_target_language(self, mock_analyze, tmp_path, instance):
+    def test_handles_missing_target_language(self, mock_analyze, tmp_path):
         season_path = tmp_path / "Season 01"
         season_path.mkdir()
         (season_path / "S01E01.mkv").write_bytes(b"x")
 
         mock_analyze.return_value = ["ja"]  # Only Japanese, missing English
-        series_meta = {"originalLanguage": {"name": "Japanese"}}
 
-        stats = tv._scan_season(str(season_path), series_meta, instance, {"en", "eng"})
+        stats = tv._scan_season(str(season_path), {"en", "eng"}, JA_CODES, EN_TARGETS)
 
         assert len(stats["missing_dub"]) == 1
 
     @patch("taggarr.processors.tv.media.analyze_audio")
-    def test_handles_non_standard_filename(self, mock_analyze, tmp_path, instance):
+    def test_formats_dub_and_missing_entries(self, mock_analyze, tmp_path):
+        season_path = tmp_path / "Season 01"
+        season_path.mkdir()
+        (season_path / "S01E01.mkv").write_bytes(b"x")
+
+        mock_analyze.return_value = ["ja", "eng", "en"]
+        targets = {t: languages.get_aliases(t) for t in ["de", "en", "fr"]}
+
+        stats = tv._scan_season(str(season_path), {"en", "eng"}, JA_CODES, targets)
+
+        assert stats["original_dub"] == ["E01"]
+        assert stats["dub"] == ["E01:en, eng"]
+        assert stats["missing_dub"] == ["E01:de, fr"]
+
+    @patch("taggarr.processors.tv.media.analyze_audio")
+    def test_handles_non_standard_filename(self, mock_analyze, tmp_path):
         season_path = tmp_path / "Season 01"
         season_path.mkdir()
         (season_path / "episode_without_number.mkv").write_bytes(b"x")
 
         mock_analyze.return_value = ["en"]
-        series_meta = {"originalLanguage": "Japanese"}
 
-        stats = tv._scan_season(str(season_path), series_meta, instance, {"en"})
+        stats = tv._scan_season(str(season_path), {"en"}, JA_CODES, EN_TARGETS)
 
         # Should use filename without extension as episode name
         assert stats["episodes"] == 1
 
 
+class TestCanReuse:
+    """Tests for _can_reuse function."""
+
+    def test_rejects_missing_entry(self):
+        assert tv._can_reuse(None, 10.0, False, "en|japanese") is False
+
+    def test_rejects_changed_mtime(self):
+        saved = {"last_modified": 5.0, "fingerprint": "en|japanese"}
+        assert tv._can_reuse(saved, 10.0, False, "en|japanese") is False
+
+    def test_accepts_unchanged_full_scan(self):
+        saved = {"last_modified": 10.0, "fingerprint": "en|japanese"}
+        assert tv._can_reuse(saved, 10.0, False, "en|japanese") is True
+        assert tv._can_reuse(saved, 10.0, True, "en|japanese") is True
+
+    def test_quick_stats_only_reused_for_quick_scan(self):
+        saved = {"last_modified": 10.0, "quick": True, "fingerprint": "en|japanese"}
+        assert tv._can_reuse(saved, 10.0, True, "en|japanese") is True
+        assert tv._can_reuse(saved, 10.0, False, "en|japanese") is False
+
+    def test_rejects_changed_fingerprint(self):
+        saved = {"last_modified": 10.0, "fingerprint": "en|japanese"}
+        assert tv._can_reuse(saved, 10.0, False, "en,fr|japanese") is False
+        assert tv._can_reuse(saved, 10.0, False, "en|korean") is False
+
+    def test_rejects_stats_without_fingerprint(self):
+        assert tv._can_reuse({"last_modified": 10.0}, 10.0, False, "en|japanese") is False
+
+
 class TestScanShow:
     """Tests for _scan_show function."""
 
+    @patch("taggarr.processors.tv._scan_season")
+    def test_season_logs_name_the_show(self, mock_scan, tmp_path, instance, caplog):
+        """Shows scan concurrently, so season log lines carry the show folder."""
+        caplog.set_level(logging.DEBUG, logger="taggarr")
+        show_path = tmp_path / "Show"
+        (show_path / "Season 01").mkdir(parents=True)
+        (show_path / "Season 02").mkdir()
+        saved = {"Season 01": {
+            "unexpected_languages": [], "dub": [], "status": "original",
+            "last_modified": os.path.getmtime(show_path / "Season 01"),
+            "fingerprint": "en|japanese",
+        }}
+        mock_scan.return_value = {"unexpected_languages": [], "dub": [], "missing_dub": []}
+
+        tv._scan_show(str(show_path), {"originalLanguage": "Japanese"}, instance, {"en"},
+                      saved_seasons=saved)
+
+        assert "Reusing cached stats for unchanged season: Season 01 of Show" in caplog.text
+        assert "Scanning season: Season 02 of Show" in caplog.text
+
     @patch("taggarr.processors.tv._scan_season")
     def test_ignores_non_season_directories(self, mock_scan, tmp_path, instance):
         """Test that non-season directories are skipped."""
@@ -372,6 +507,137 @@ class TestScanShow:
         assert "Season 01" in seasons
         assert "Extras" not in seasons
 
+    @patch("taggarr.processors.tv._scan_season")
+    def test_passes_precomputed_language_sets(self, mock_scan, tmp_path, instance):
+        show_path = tmp_path / "Show"
+        (show_path / "Season 01").mkdir(parents=True)
+        (show_path / "Season 02").mkdir()
+
+        mock_scan.return_value = {
+            "unexpected_languages": [],
+            "dub": ["E01"],
+            "missing_dub": [],
+        }
+        series_meta = {"originalLanguage": {"name": "Japanese"}}
+
+        tv._scan_show(str(show_path), series_meta, instance, {"en"})
+
+        assert mock_scan.call_count == 2
+        for call in mock_scan.call_args_list:
+            _, _, original_codes, target_aliases, _ = call.args
+            assert original_codes == JA_CODES
+            assert target_aliases == EN_TARGETS
+
+    @patch("taggarr.processors.tv._scan_season")
+    def test_scans_multiple_seasons_in_order(self, mock_scan, tmp_path, instance):
+        show_path = tmp_path / "Show"
+        for name in ["Season 03", "Season 01", "Season 02"]:
+            (show_path / name).mkdir(parents=True)
+
+        mock_scan.side_effect = lambda *args: {
+            "unexpected_languages": [],
+            "dub": ["E01"],
+            "missing_dub": [],
+        }
+        series_meta = {"originalLanguage": "Japanese"}
+
+        tag, seasons = tv._scan_show(str(show_path), series_meta, instance, {"en"})
+
+        assert list(seasons) == ["Season 01", "Season 02", "Season 03"]
+        assert tag == instance.tags.dub
+
+    @patch("taggarr.processors.tv._scan_season")
+    def test_uses_provided_season_listing(self, mock_scan, tmp_path, instance):
+        saved = {"Season 01": {"status": "original", "unexpected_languages": [],
+                               "dub": [], "last_modified": 500, "fingerprint": "en|japanese"}}
+        series_meta = {"originalLanguage": "Japanese"}
+
+        with patch("taggarr.processors.tv._list_seasons") as mock_list:
+            tag, seasons = tv._scan_show(
+                str(tmp_path), series_meta, instance, {"en"},
+                saved_seasons=saved, season_mtimes={"Season 01": 500},
+            )
+
+        mock_list.assert_not_called()
+        mock_scan.assert_not_called()
+        assert seasons["Season 01"] is saved["Season 01"]
+
+    @patch("taggarr.processors.tv._scan_season")
+    def test_reuses_saved_stats_for_unchanged_season(self, mock_scan, tmp_path, instance):
+        show_path = tmp_path / "Show"
+        (show_path / "Season 01").mkdir(parents=True)
+        (show_path / "Season 02").mkdir()
+
+        saved = {
+            "Season 01": {
+                "unexpected_languages": [],
+                "dub": ["E01:en"],
+                "missing_dub": [],
+                "status": "fully-dub",
+                "last_modified": os.path.getmtime(show_path / "Season 01"),
+                "fingerprint": "en|japanese",
+            },
+            "Season 02": {"status": "original", "last_modified": 0},
+        }
+        mock_scan.return_value = {
+            "unexpected_languages": [],
+            "dub": ["E01:en"],
+            "missing_dub": [],
+        }
+        series_meta = {"originalLanguage": "Japanese"}
+
+        tag, seasons = tv._scan_show(
+            str(show_path), series_meta, instance, {"en"}, saved_seasons=saved
+        )
+
+        mock_scan.assert_called_once()
+        assert mock_scan.call_args.args[0].endswith("Season 02")
+        assert seasons["Season 01"] is saved["Season 01"]
+        assert tag == instance.tags.dub
+
+    @patch("taggarr.processors.tv._scan_season")
+    def test_rescans_season_after_target_languages_change(self, mock_scan, tmp_path, instance):
+        show_path = tmp_path / "Show"
+        (show_path / "Season 01").mkdir(parents=True)
+
+        saved = {"Season 01": {
+            "unexpected_languages": [], "dub": ["E01:en"], "missing_dub": [],
+            "status": "fully-dub",
+            "last_modified": os.path.getmtime(show_path / "Season 01"),
+            "fingerprint": "en|japanese",
+        }}
+        mock_scan.return_value = {
+            "unexpected_languages": [],
+            "dub": ["E01:en"],
+            "missing_dub": ["E01:fr"],
+        }
+        instance.target_languages = ["fr", "en"]
+        series_meta = {"originalLanguage": "Japanese"}
+
+        tag, seasons = tv._scan_show(
+            str(show_path), series_meta, instance, {"en", "fr"}, saved_seasons=saved
+        )
+
+        mock_scan.assert_called_once()
+        assert seasons["Season 01"]["fingerprint"] == "en,fr|japanese"
+        assert tag == instance.tags.semi
+
+    @patch("taggarr.processors.tv._scan_season")
+    def test_marks_quick_scanned_seasons(self, mock_scan, tmp_path, instance):
+        show_path = tmp_path / "Show"
+        (show_path / "Season 01").mkdir(parents=True)
+
+        mock_scan.return_value = {
+            "unexpected_languages": [],
+            "dub": [],
+            "missing_dub": [],
+        }
+        series_meta = {"originalLanguage": "Japanese"}
+
+        _, seasons = tv._scan_show(str(show_path), series_meta, instance, {"en"}, quick=True)
+
+        assert seasons["Season 01"]["quick"] is True
+
     @patch("taggarr.processors.tv._scan_season")
     def test_returns_wrong_when_unexpected_found(self, mock_scan, tmp_path, instance):
         show_path = tmp_path / "Show"
@@ -553,8 +819,10 @@ class TestProcessAll:
 
         result = tv.process_all(client, instance, opts, taggarr_data)
 
-        # Should call remove_tag for each tag type
-        assert client.remove_tag.call_count == 3
+        # Should remove every managed tag in one request
+        client.bulk_edit_tags.assert_called_once_with(
+            [123], ["dub", "semi-dub", "wrong-dub"], "remove", False
+        )
         # Show should be removed from data
         assert str(show_path) not in result["series"]
         assert "Removing tags" in caplog.text
@@ -575,8 +843,10 @@ class TestProcessAll:
 
         result = tv.process_all(client, instance, opts, taggarr_data)
 
-        # Should still call remove_tag for each tag type
-        assert client.remove_tag.call_count == 3
+        # Should still remove every managed tag
+        client.bulk_edit_tags.assert_called_once_with(
+            [123], ["dub", "semi-dub", "wrong-dub"], "remove", False
+        )
         # Should not fail even though show wasn't in data
         assert str(show_path) not in result["series"]
 
@@ -605,6 +875,179 @@ class TestProcessAll:
         assert str(show_path) in result["series"]
         assert "Processing show" in caplog.text
 
+    @patch("taggarr.processors.tv._scan_show")
+    @patch("taggarr.processors.tv._apply_tags")
+    def test_keys_entries_by_normalized_absolute_path(self, mock_apply, mock_scan, tmp_path, opts, instance, monkeypatch):
+        show_path = tmp_path / "lib" / "TestShow"
+        (show_path / "Season 01").mkdir(parents=True)
+        (show_path / "tvshow.nfo").write_text("<tvshow></tvshow>")
+
+        monkeypatch.chdir(tmp_path)
+        instance.root_path = "lib/./"
+        client = Mock()
+        client.get_series_by_path.return_value = {"id": 1}
+        mock_scan.return_value = (None, {})
+
+        result = tv.process_all(client, instance, opts, {"series": {}})
+
+        assert list(result["series"]) == [str(show_path)]
+        client.get_series_by_path.assert_called_once_with(str(show_path))
+
+    @patch("taggarr.processors.tv._scan_show")
+    @patch("taggarr.processors.tv.nfo.update_tag")
+    @patch("taggarr.processors.tv._apply_tags")
+    def test_processes_shows_concurrently_and_merges_results(self, mock_apply, mock_update_tag, mock_scan, tmp_path, opts, instance):
+        """Multiple shows are scanned in the pool and merged in folder order."""
+        ids = {}
+        for i, name in enumerate(["C Show", "A Show", "B Show"], start=1):
+            (tmp_path / name / "Season 01").mkdir(parents=True)
+            (tmp_path / name / "tvshow.nfo").write_text("<tvshow></tvshow>")
+            ids[str(tmp_path / name)] = i
+
+        instance.root_path = str(tmp_path)
+        client = Mock()
+        client.get_series_by_path.side_effect = lambda path: {"id": ids[path]}
+        mock_scan.return_value = (instance.tags.dub, {"Season 01": {"status": "fully-dub"}})
+
+        result = tv.process_all(client, instance, opts, {"series": {}})
+
+        assert list(result["series"]) == [str(tmp_path / n) for n in ["A Show", "B Show", "C Show"]]
+        assert mock_apply.call_args[0][1] == {"dub": [2, 3, 1]}
+
+    @patch("taggarr.processors.tv._scan_show")
+    @patch("taggarr.processors.tv.nfo.update_tag")
+    @patch("taggarr.processors.tv._apply_tags")
+    def test_failing_show_keeps_other_tags(self, mock_apply, mock_update_tag, mock_scan, tmp_path, opts, instance, caplog):
+        """An error in one show is logged and the others are still tagged."""
+        for name in ["A Show", "B Show"]:
+            (tmp_path / name / "Season 01").mkdir(parents=True)
+            (tmp_path / name / "tvshow.nfo").write_text("<tvshow></tvshow>")
+
+        def scan(show_path, *args, **kwargs):
+            if show_path.endswith("A Show"):
+                raise PermissionError("denied")
+            return instance.tags.dub, {"Season 01": {"status": "fully-dub"}}
+
+        instance.root_path = str(tmp_path)
+        client = Mock()
+        client.get_series_by_path.side_effect = lambda path: {"id": 2 if path.endswith("B Show") else 1}
+        mock_scan.side_effect = scan
+
+        result = tv.process_all(client, instance, opts, {"series": {}})
+
+        assert "Failed to process show A Show: denied" in caplog.text
+        assert mock_apply.call_args[0][1] == {"dub": [2]}
+        assert list(result["series"]) == [str(tmp_path / "B Show")]
+
+    @patch("taggarr.processors.tv.ThreadPoolExecutor")
+    @patch("taggarr.processors.tv._scan_show")
+    @patch("taggarr.processors.tv.nfo.update_tag")
+    @patch("taggarr.processors.tv._apply_tags")
+    def test_single_scan_worker_runs_inline(self, mock_apply, mock_update_tag, mock_scan, mock_pool, tmp_path, opts, instance):
+        """scan_workers of 1 processes shows without a thread pool."""
+        for name in ["A Show", "B Show"]:
+            (tmp_path / name / "Season 01").mkdir(parents=True)
+            (tmp_path / name / "tvshow.nfo").write_text("<tvshow></tvshow>")
+
+        instance.root_path = str(tmp_path)
+        instance.scan_workers = 1
+        client = Mock()
+        client.get_series_by_path.return_value = {"id": 1}
+        mock_scan.return_value = (None, {})
+
+        result = tv.process_all(client, instance, opts, {"series": {}})
+
+        mock_pool.assert_not_called()
+        assert len(result["series"]) == 2
+
+    @patch("taggarr.processors.tv._scan_show")
+    @patch("taggarr.processors.tv.nfo.update_tag")
+    @patch("taggarr.processors.tv._apply_tags")
+    def test_genre_filter_tree_reused_for_tag_update(self, mock_apply, mock_update_tag, mock_scan, tmp_path, opts, instance):
+        """The NFO parsed for the genre filter is handed to update_tag."""
+        show_path = tmp_path / "TestShow"
+        (show_path / "Season 01").mkdir(parents=True)
+        (show_path / "tvshow.nfo").write_text("<tvshow><genre>Anime</genre></tvshow>")
+
+        instance.root_path = str(tmp_path)
+        instance.target_genre = "Anime"
+        client = Mock()
+        client.get_series_by_path.return_value = {"id": 123, "originalLanguage": "Japanese"}
+        mock_scan.return_value = (instance.tags.dub, {"Season 01": {"status": "fully-dub"}})
+
+        with patch("taggarr.processors.tv.nfo.safe_parse", wraps=tv.nfo.safe_parse) as mock_parse:
+            tv.process_all(client, instance, opts, {"series": {}})
+
+        mock_parse.assert_called_once()
+        assert mock_update_tag.call_args.kwargs["root"].tag == "tvshow"
+
+    @patch("taggarr.processors.tv._scan_show")
+    @patch("taggarr.processors.tv._apply_tags")
+    def test_unchanged_nfo_skips_genre_parse(self, mock_apply, mock_scan, tmp_path, opts, instance):
+        """A saved show whose NFO mtime is unchanged is not re-parsed."""
+        show_path = tmp_path / "TestShow"
+        (show_path / "Season 01").mkdir(parents=True)
+        nfo_path = show_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow><genre>Anime</genre></tvshow>")
+
+        instance.root_path = str(tmp_path)
+        instance.target_genre = "Anime"
+        client = Mock()
+        client.get_series_by_path.return_value = {"id": 123}
+        mock_scan.return_value = (None, {"Season 01": {"status": "original"}})
+        taggarr_data = {"series": {str(show_path): {
+            "seasons": {}, "nfo_mtime": os.path.getmtime(nfo_path), "target_genre": "anime",
+        }}}
+
+        with patch("taggarr.processors.tv.nfo.load") as mock_load:
+            result = tv.process_all(client, instance, opts, taggarr_data)
+
+        mock_load.assert_not_called()
+        mock_scan.assert_called_once()
+        assert result["series"][str(show_path)]["nfo_mtime"] == os.path.getmtime(nfo_path)
+        assert result["series"][str(show_path)]["target_genre"] == "anime"
+
+    @patch("taggarr.processors.tv._scan_show")
+    @patch("taggarr.processors.tv._apply_tags")
+    def test_changed_target_genre_rechecks_unchanged_nfo(self, mock_apply, mock_scan, tmp_path, opts, instance):
+        """A show saved under another target genre is filtered again."""
+        show_path = tmp_path / "TestShow"
+        (show_path / "Season 01").mkdir(parents=True)
+        nfo_path = show_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow><genre>Drama</genre></tvshow>")
+
+        instance.root_path = str(tmp_path)
+        instance.target_genre = "Anime"
+        client = Mock()
+        taggarr_data = {"series": {str(show_path): {
+            "seasons": {}, "nfo_mtime": os.path.getmtime(nfo_path), "target_genre": None,
+        }}}
+
+        tv.process_all(client, instance, opts, taggarr_data)
+
+        mock_scan.assert_not_called()
+        client.get_series_by_path.assert_not_called()
+
+    @patch("taggarr.processors.tv._scan_show")
+    @patch("taggarr.processors.tv._apply_tags")
+    def test_stores_nfo_mtime_after_tag_write(self, mock_apply, mock_scan, tmp_path, opts, instance):
+        show_path = tmp_path / "TestShow"
+        (show_path / "Season 01").mkdir(parents=True)
+        nfo_path = show_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow><genre>Drama</genre></tvshow>")
+        os.utime(nfo_path, (1000, 1000))
+
+        instance.root_path = str(tmp_path)
+        client = Mock()
+        client.get_series_by_path.return_value = {"id": 123}
+        mock_scan.return_value = (instance.tags.dub, {"Season 01": {"status": "fully-dub"}})
+
+        result = tv.process_all(client, instance, opts, {"series": {}})
+
+        saved = result["series"][str(show_path)]["nfo_mtime"]
+        assert saved == os.path.getmtime(nfo_path)
+        assert saved != 1000
+
     @patch("taggarr.processors.tv._scan_show")
     @patch("taggarr.processors.tv.nfo.update_tag")
     @patch("taggarr.processors.tv._apply_tags")
@@ -695,7 +1138,7 @@ class TestProcessAll:
 
         # dry_run should be True in _apply_tags call
         mock_apply.assert_called_once()
-        assert mock_apply.call_args[0][4] is True  # dry_run argument
+        assert mock_apply.call_args[0][3] is True  # dry_run argument
 
     @patch("taggarr.processors.tv._scan_show")
     @patch("taggarr.processors.tv.nfo.update_tag")
@@ -15,10 +15,12 @@ class MockTrack:
         self.title = title
 
 
-class MockMediaInfo:
-    """Mock MediaInfo result."""
-    def __init__(self, tracks):
-        self.tracks = tracks
+def inform_output(tracks):
+    """Build the text MediaInfo returns for the audio Inform template."""
+    return "".join(
+        f"{t.language or ''}\x1f{t.title or ''}\x1e"
+        for t in tracks if t.track_type == "Audio"
+    )
 
 
 class TestAnalyzeAudio:
@@ -26,7 +28,7 @@ class TestAnalyzeAudio:
 
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_returns_language_codes_from_audio_tracks(self, mock_parse):
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language="en"),
             MockTrack("Audio", language="ja"),
             MockTrack("Video"),  # Should be ignored
@@ -36,9 +38,19 @@ class TestAnalyzeAudio:
 
         assert sorted(result) == ["en", "ja"]
 
+    @patch("taggarr.services.media.MediaInfo.parse")
+    def test_uses_shallow_parse_speed(self, mock_parse):
+        mock_parse.return_value = inform_output([])
+
+        media.analyze_audio("/path/to/video.mkv")
+
+        mock_parse.assert_called_once_with(
+            "/path/to/video.mkv", parse_speed=media.PARSE_SPEED, output=media._AUDIO_INFORM
+        )
+
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_returns_empty_list_on_no_audio_tracks(self, mock_parse):
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Video"),
         ])
 
@@ -48,7 +60,7 @@ class TestAnalyzeAudio:
 
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_uses_fallback_for_empty_title_track(self, mock_parse):
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language="", title=""),
         ])
 
@@ -58,7 +70,7 @@ class TestAnalyzeAudio:
 
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_uses_fallback_for_track_1_title(self, mock_parse):
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language="", title="Track 1"),
         ])
 
@@ -68,7 +80,7 @@ class TestAnalyzeAudio:
 
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_uses_fallback_for_audio_1_title(self, mock_parse):
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language=None, title="Audio 1"),
         ])
 
@@ -78,7 +90,7 @@ class TestAnalyzeAudio:
 
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_handles_mixed_labeled_and_unlabeled(self, mock_parse):
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language="en"),
             MockTrack("Audio", language="", title="Track 1"),  # Fallback
         ])
@@ -88,6 +100,16 @@ class TestAnalyzeAudio:
         assert "en" in result
         assert "__fallback_original__" in result
 
+    @patch("taggarr.services.media.MediaInfo.parse")
+    def test_keeps_separators_inside_titles(self, mock_parse):
+        mock_parse.return_value = inform_output([
+            MockTrack("Audio", language="", title="Track 1\tMain | Stereo"),
+        ])
+
+        result = media.analyze_audio("/path/to/video.mkv")
+
+        assert result == ["__fallback_original__"]
+
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_returns_empty_list_on_parse_error(self, mock_parse, caplog):
         caplog.set_level(logging.WARNING)
@@ -100,7 +122,7 @@ class TestAnalyzeAudio:
 
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_normalizes_language_to_lowercase(self, mock_parse):
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language="EN"),
             MockTrack("Audio", language="  JA  "),
         ])
@@ -112,7 +134,7 @@ class TestAnalyzeAudio:
 
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_deduplicates_languages(self, mock_parse):
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language="en"),
             MockTrack("Audio", language="en"),
         ])
@@ -124,7 +146,7 @@ class TestAnalyzeAudio:
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_logs_debug_for_fallback_detection(self, mock_parse, caplog):
         caplog.set_level(logging.DEBUG, logger="taggarr")
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language="", title=""),
         ])
 
@@ -135,7 +157,7 @@ class TestAnalyzeAudio:
     @patch("taggarr.services.media.MediaInfo.parse")
     def test_does_not_use_fallback_for_named_track(self, mock_parse):
         """Test that tracks with descriptive titles don't trigger fallback."""
-        mock_parse.return_value = MockMediaInfo([
+        mock_parse.return_value = inform_output([
             MockTrack("Audio", language="", title="Commentary"),
         ])
 
@@ -1,9 +1,13 @@
 """Tests for taggarr.services.radarr module."""
 
+import json
 import logging
 import pytest
+import requests
 import responses
+from unittest.mock import Mock
 
+from taggarr.services import radarr
 from taggarr.services.radarr import RadarrClient
 
 
@@ -28,39 +32,20 @@ class TestRadarrClientInit:
         client = RadarrClient(url="http://radarr:7878", api_key="my-key")
         assert client._headers == {"X-Api-Key": "my-key"}
 
-
-class TestGetMovies:
-    """Tests for get_movies method."""
-
-    @responses.activate
-    def test_returns_all_movies(self, client):
-        responses.add(
-            responses.GET,
-            "http://radarr:7878/api/v3/movie",
-            json=[
-                {"id": 1, "title": "Inception"},
-                {"id": 2, "title": "Interstellar"},
-            ],
-        )
-
-        result = client.get_movies()
-
-        assert len(result) == 2
-        assert result[0]["title"] == "Inception"
+    def test_session_mounts_retrying_adapter(self):
+        client = RadarrClient(url="http://radarr:7878", api_key="my-key")
+        adapter = client._session.get_adapter("http://radarr:7878")
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
 
     @responses.activate
-    def test_returns_empty_list_on_error(self, client, caplog):
-        caplog.set_level(logging.WARNING)
-        responses.add(
-            responses.GET,
-            "http://radarr:7878/api/v3/movie",
-            body=Exception("Connection error"),
-        )
+    def test_session_sends_api_key_header(self):
+        client = RadarrClient(url="http://radarr:7878", api_key="my-key")
+        responses.add(responses.GET, "http://radarr:7878/api/v3/movie", json=[])
 
-        result = client.get_movies()
+        client.get_movie_by_path("/media/movies/Movie")
 
-        assert result == []
-        assert "Failed to fetch" in caplog.text
+        assert responses.calls[0].request.headers["X-Api-Key"] == "my-key"
 
 
 class TestGetMovieByPath:
@@ -139,74 +124,152 @@ class TestGetMovieByPath:
         assert result["id"] == 1
 
 
-class TestAddTag:
-    """Tests for add_tag method."""
+    @responses.activate
+    def test_fetches_movie_list_only_once(self, client):
+        responses.add(
+            responses.GET,
+            "http://radarr:7878/api/v3/movie",
+            json=[
+                {"id": 1, "title": "Inception", "path": "/media/movies/Inception (2010)"},
+                {"id": 2, "title": "Tenet", "path": "/media/movies/Tenet (2020)"},
+            ],
+        )
+
+        assert client.get_movie_by_path("/media/movies/Inception (2010)")["id"] == 1
+        assert client.get_movie_by_path("/media/movies/Tenet (2020)")["id"] == 2
+        assert client.get_movie_by_path("/media/movies/Missing") is None
+
+        assert len(responses.calls) == 1
 
     @responses.activate
-    def test_adds_tag_to_movie(self, client):
-        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[])
-        responses.add(responses.POST, "http://radarr:7878/api/v3/tag", json={"id": 1, "label": "dub"})
-        responses.add(responses.GET, "http://radarr:7878/api/v3/movie/42", json={"id": 42, "tags": []})
-        responses.add(responses.PUT, "http://radarr:7878/api/v3/movie/42", json={"id": 42, "tags": [1]})
+    def test_retries_fetch_after_api_error(self, client):
+        responses.add(responses.GET, "http://radarr:7878/api/v3/movie", status=500)
+        responses.add(
+            responses.GET,
+            "http://radarr:7878/api/v3/movie",
+            json=[{"id": 1, "title": "Movie", "path": "/media/movies/Movie"}],
+        )
 
-        client.add_tag(42, "dub")
+        assert client.get_movie_by_path("/media/movies/Movie") is None
+        assert client.get_movie_by_path("/media/movies/Movie")["id"] == 1
 
-        assert len([c for c in responses.calls if c.request.method == "PUT"]) == 1
 
-    def test_dry_run_does_not_call_api(self, client, caplog):
-        caplog.set_level(logging.INFO)
-        client.add_tag(42, "dub", dry_run=True)
-        assert "Dry Run" in caplog.text
+class TestBulkEditTags:
+    """Tests for bulk_edit_tags method."""
 
     @responses.activate
-    def test_uses_existing_tag_if_found(self, client):
+    def test_adds_tag_to_all_movies_in_one_request(self, client):
         responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[{"id": 5, "label": "dub"}])
-        responses.add(responses.GET, "http://radarr:7878/api/v3/movie/42", json={"id": 42, "tags": []})
-        responses.add(responses.PUT, "http://radarr:7878/api/v3/movie/42", json={"id": 42, "tags": [5]})
+        responses.add(responses.PUT, "http://radarr:7878/api/v3/movie/editor", json=[])
+
+        client.bulk_edit_tags([1, 2], ["dub"], "add")
+
+        put_calls = [c for c in responses.calls if c.request.method == "PUT"]
+        assert len(put_calls) == 1
+        assert json.loads(put_calls[0].request.body) == {
+            "movieIds": [1, 2], "tags": [5], "applyTags": "add",
+        }
+
+    @responses.activate
+    def test_remove_without_known_tags_sends_nothing(self, client):
+        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[])
 
-        client.add_tag(42, "dub")
+        client.bulk_edit_tags([1], ["dub"], "remove")
 
-        # Should not have created a new tag
-        assert len([c for c in responses.calls if c.request.method == "POST"]) == 0
+        assert len(responses.calls) == 1
 
     @responses.activate
-    def test_does_not_add_duplicate_tag(self, client):
-        """Test that tag is not added if movie already has it."""
+    def test_updates_cached_movie_tags(self, client):
+        responses.add(
+            responses.GET,
+            "http://radarr:7878/api/v3/movie",
+            json=[
+                {"id": 1, "path": "/movies/A", "tags": [5, 7]},
+                {"id": 2, "path": "/movies/B", "tags": [7]},
+            ],
+        )
         responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[{"id": 5, "label": "dub"}])
-        responses.add(responses.GET, "http://radarr:7878/api/v3/movie/42", json={"id": 42, "tags": [5]})
-        responses.add(responses.PUT, "http://radarr:7878/api/v3/movie/42", json={"id": 42, "tags": [5]})
+        responses.add(responses.PUT, "http://radarr:7878/api/v3/movie/editor", json=[])
+        client.get_movie_by_path("/movies/A")
 
-        client.add_tag(42, "dub")
+        client.bulk_edit_tags([1, 2, 99], ["dub"], "add")
+        assert client.get_movie_by_path("/movies/B")["tags"] == [7, 5]
+        assert client.get_movie_by_path("/movies/A")["tags"] == [5, 7]
 
-        # PUT should still be called but tag list unchanged
-        put_calls = [c for c in responses.calls if c.request.method == "PUT"]
-        assert len(put_calls) == 1
+        client.bulk_edit_tags([1], ["dub"], "remove")
+        assert client.get_movie_by_path("/movies/A")["tags"] == [7]
 
+    @responses.activate
+    def test_splits_large_id_lists_into_batches(self, client, monkeypatch):
+        monkeypatch.setattr("taggarr.services.radarr.EDITOR_BATCH_SIZE", 2)
+        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[{"id": 5, "label": "dub"}])
+        responses.add(responses.PUT, "http://radarr:7878/api/v3/movie/editor", json=[])
+
+        client.bulk_edit_tags([1, 2, 3, 4, 5], ["dub"], "add")
 
-class TestRemoveTag:
-    """Tests for remove_tag method."""
+        put_calls = [c for c in responses.calls if c.request.method == "PUT"]
+        assert [json.loads(c.request.body)["movieIds"] for c in put_calls] == [[1, 2], [3, 4], [5]]
 
     @responses.activate
-    def test_removes_tag_from_movie(self, client):
+    def test_only_sends_ids_whose_tags_differ(self, client):
+        responses.add(
+            responses.GET,
+            "http://radarr:7878/api/v3/movie",
+            json=[
+                {"id": 1, "path": "/lib/A", "tags": [5]},
+                {"id": 2, "path": "/lib/B", "tags": []},
+            ],
+        )
         responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[{"id": 5, "label": "dub"}])
-        responses.add(responses.GET, "http://radarr:7878/api/v3/movie/42", json={"id": 42, "tags": [5]})
-        responses.add(responses.PUT, "http://radarr:7878/api/v3/movie/42", json={"id": 42, "tags": []})
+        responses.add(responses.PUT, "http://radarr:7878/api/v3/movie/editor", json=[])
+        client.get_movie_by_path("/lib/A")
 
-        client.remove_tag(42, "dub")
+        client.bulk_edit_tags([1, 2, 3], ["dub"], "add")
+        client.bulk_edit_tags([2], ["dub"], "add")
+        client.bulk_edit_tags([1], ["dub"], "remove")
 
-        assert len([c for c in responses.calls if c.request.method == "PUT"]) == 1
+        put_calls = [c for c in responses.calls if c.request.method == "PUT"]
+        assert [json.loads(c.request.body)["movieIds"] for c in put_calls] == [[2, 3], [1]]
 
     @responses.activate
-    def test_does_nothing_if_tag_not_found(self, client):
-        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[])
+    def test_skips_request_when_already_up_to_date(self, client, caplog):
+        caplog.set_level(logging.DEBUG, logger="taggarr")
+        responses.add(
+            responses.GET,
+            "http://radarr:7878/api/v3/movie",
+            json=[{"id": 1, "path": "/lib/A", "tags": [5]}],
+        )
+        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[{"id": 5, "label": "dub"}, {"id": 6, "label": "semi-dub"}])
+        client.get_movie_by_path("/lib/A")
+
+        client.bulk_edit_tags([1], ["dub"], "add")
+        client.bulk_edit_tags([1], ["semi-dub"], "remove")
+
+        assert all(c.request.method == "GET" for c in responses.calls)
+        assert "already up to date" in caplog.text
 
-        client.remove_tag(42, "nonexistent")  # Should not raise
+    def test_empty_ids_does_nothing(self, client):
+        client.bulk_edit_tags([], ["dub"], "add")
 
     def test_dry_run_does_not_call_api(self, client, caplog):
         caplog.set_level(logging.INFO)
-        client.remove_tag(42, "dub", dry_run=True)
+        client.bulk_edit_tags([1], ["dub"], "remove", dry_run=True)
         assert "Dry Run" in caplog.text
 
+    @responses.activate
+    def test_handles_api_error(self, client, caplog):
+        caplog.set_level(logging.WARNING)
+        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[{"id": 5, "label": "dub"}])
+        responses.add(
+            responses.PUT,
+            "http://radarr:7878/api/v3/movie/editor",
+            body=Exception("Connection refused"),
+        )
+
+        client.bulk_edit_tags([1], ["dub"], "remove")
+
+        assert "Failed to bulk edit" in caplog.text
+
 
 class TestGetTagId:
     """Tests for _get_tag_id method."""
@@ -260,37 +323,69 @@ class TestGetTagId:
         assert result is None
 
 
-class TestModifyMovieTags:
-    """Tests for _modify_movie_tags method."""
-
     @responses.activate
-    def test_handles_api_error(self, client, caplog):
-        caplog.set_level(logging.WARNING)
+    def test_fetches_tag_list_only_once(self, client):
         responses.add(
             responses.GET,
-            "http://radarr:7878/api/v3/movie/42",
-            body=Exception("Connection error"),
+            "http://radarr:7878/api/v3/tag",
+            json=[{"id": 1, "label": "dub"}, {"id": 2, "label": "wrong-dub"}],
         )
 
-        # Should not raise
-        client._modify_movie_tags(42, 1, remove=False)
+        assert client._get_tag_id("dub") == 1
+        assert client._get_tag_id("wrong-dub") == 2
+        assert client._get_tag_id("semi-dub") is None
 
-        assert "Failed to modify" in caplog.text
+        assert len(responses.calls) == 1
 
     @responses.activate
-    def test_removes_tag_when_present(self, client):
+    def test_created_tag_is_cached(self, client):
         responses.add(
             responses.GET,
-            "http://radarr:7878/api/v3/movie/42",
-            json={"id": 42, "tags": [1, 2, 3]},
+            "http://radarr:7878/api/v3/tag",
+            json=[{"id": 1, "label": "dub"}],
         )
         responses.add(
-            responses.PUT,
-            "http://radarr:7878/api/v3/movie/42",
-            json={"id": 42, "tags": [1, 3]},
+            responses.POST,
+            "http://radarr:7878/api/v3/tag",
+            json={"id": 7, "label": "wrong-dub"},
         )
 
-        client._modify_movie_tags(42, 2, remove=True)
+        assert client._get_or_create_tag("wrong-dub") == 7
+        assert client._get_tag_id("wrong-dub") == 7
+
+        get_calls = [c for c in responses.calls if c.request.method == "GET"]
+        assert len(get_calls) == 1
+
+    @responses.activate
+    def test_created_tag_not_cached_when_list_unavailable(self, client):
+        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", status=500)
+        responses.add(
+            responses.POST,
+            "http://radarr:7878/api/v3/tag",
+            json={"id": 7, "label": "dub"},
+        )
+
+        assert client._get_or_create_tag("dub") == 7
+        assert client._tag_cache is None
+
+
+class TestDecode:
+    """Tests for _decode helper."""
+
+    @responses.activate
+    def test_uses_orjson_when_available(self, monkeypatch):
+        fake = Mock()
+        fake.loads.return_value = [{"id": 1}]
+        monkeypatch.setattr(radarr, "orjson", fake)
+        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", body=b'[{"id": 1}]')
+
+        assert radarr._decode(requests.get("http://radarr:7878/api/v3/tag")) == [{"id": 1}]
+        fake.loads.assert_called_once_with(b'[{"id": 1}]')
+
+    @responses.activate
+    def test_falls_back_to_response_json(self, monkeypatch):
+        monkeypatch.setattr(radarr, "orjson", None)
+        responses.add(responses.GET, "http://radarr:7878/api/v3/tag", json=[{"id": 1}])
+
+        assert radarr._decode(requests.get("http://radarr:7878/api/v3/tag")) == [{"id": 1}]
 
-        put_calls = [c for c in responses.calls if c.request.method == "PUT"]
-        assert len(put_calls) == 1
@@ -1,9 +1,13 @@
 """Tests for taggarr.services.sonarr module."""
 
+import json
 import logging
 import pytest
+import requests
 import responses
+from unittest.mock import Mock
 
+from taggarr.services import sonarr
 from taggarr.services.sonarr import SonarrClient
 
 
@@ -28,6 +32,21 @@ class TestSonarrClientInit:
         client = SonarrClient(url="http://sonarr:8989", api_key="my-key")
         assert client._headers == {"X-Api-Key": "my-key"}
 
+    def test_session_mounts_retrying_adapter(self):
+        client = SonarrClient(url="http://sonarr:8989", api_key="my-key")
+        adapter = client._session.get_adapter("http://sonarr:8989")
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    @responses.activate
+    def test_session_sends_api_key_header(self):
+        client = SonarrClient(url="http://sonarr:8989", api_key="my-key")
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/series", json=[])
+
+        client.get_series_by_path("/media/tv/Show")
+
+        assert responses.calls[0].request.headers["X-Api-Key"] == "my-key"
+
 
 class TestGetSeriesByPath:
     """Tests for get_series_by_path method."""
@@ -90,6 +109,36 @@ class TestGetSeriesByPath:
         assert result["id"] == 1
 
 
+    @responses.activate
+    def test_fetches_series_list_only_once(self, client):
+        responses.add(
+            responses.GET,
+            "http://sonarr:8989/api/v3/series",
+            json=[
+                {"id": 1, "title": "Breaking Bad", "path": "/media/tv/Breaking Bad"},
+                {"id": 2, "title": "Better Call Saul", "path": "/media/tv/Better Call Saul"},
+            ],
+        )
+
+        assert client.get_series_by_path("/media/tv/Breaking Bad")["id"] == 1
+        assert client.get_series_by_path("/media/tv/Better Call Saul")["id"] == 2
+        assert client.get_series_by_path("/media/tv/Missing") is None
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_retries_fetch_after_api_error(self, client):
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/series", status=500)
+        responses.add(
+            responses.GET,
+            "http://sonarr:8989/api/v3/series",
+            json=[{"id": 1, "title": "Show", "path": "/media/tv/Show"}],
+        )
+
+        assert client.get_series_by_path("/media/tv/Show") is None
+        assert client.get_series_by_path("/media/tv/Show")["id"] == 1
+
+
 class TestGetSeriesId:
     """Tests for get_series_id method."""
 
@@ -118,148 +167,136 @@ class TestGetSeriesId:
         assert result is None
 
 
-class TestAddTag:
-    """Tests for add_tag method."""
+class TestBulkEditTags:
+    """Tests for bulk_edit_tags method."""
 
     @responses.activate
-    def test_adds_tag_to_series(self, client):
-        # Mock get tags (tag doesn't exist)
-        responses.add(
-            responses.GET,
-            "http://sonarr:8989/api/v3/tag",
-            json=[],
-        )
-        # Mock create tag
-        responses.add(
-            responses.POST,
-            "http://sonarr:8989/api/v3/tag",
-            json={"id": 1, "label": "dub"},
-        )
-        # Mock get series
-        responses.add(
-            responses.GET,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "title": "Test", "tags": []},
-        )
-        # Mock update series
-        responses.add(
-            responses.PUT,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "title": "Test", "tags": [1]},
-        )
+    def test_adds_tag_to_all_series_in_one_request(self, client):
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", json=[{"id": 5, "label": "dub"}])
+        responses.add(responses.PUT, "http://sonarr:8989/api/v3/series/editor", json=[])
 
-        client.add_tag(42, "dub")
+        client.bulk_edit_tags([1, 2, 3], ["dub"], "add")
 
-        # Verify PUT was called
         put_calls = [c for c in responses.calls if c.request.method == "PUT"]
         assert len(put_calls) == 1
+        assert json.loads(put_calls[0].request.body) == {
+            "seriesIds": [1, 2, 3], "tags": [5], "applyTags": "add",
+        }
 
-    def test_dry_run_does_not_call_api(self, client, caplog):
-        # No responses mocked - would fail if API called
-        caplog.set_level(logging.INFO)
-        client.add_tag(42, "dub", dry_run=True)
+    @responses.activate
+    def test_remove_skips_unknown_tags(self, client):
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", json=[{"id": 5, "label": "dub"}])
+        responses.add(responses.PUT, "http://sonarr:8989/api/v3/series/editor", json=[])
 
-        assert "Dry Run" in caplog.text
+        client.bulk_edit_tags([1], ["dub", "semi-dub"], "remove")
+
+        assert json.loads(responses.calls[1].request.body)["tags"] == [5]
 
     @responses.activate
-    def test_uses_existing_tag_if_found(self, client):
-        # Mock get tags (tag exists)
-        responses.add(
-            responses.GET,
-            "http://sonarr:8989/api/v3/tag",
-            json=[{"id": 5, "label": "dub"}],
-        )
-        # Mock get series
-        responses.add(
-            responses.GET,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "title": "Test", "tags": []},
-        )
-        # Mock update series
-        responses.add(
-            responses.PUT,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "title": "Test", "tags": [5]},
-        )
+    def test_remove_without_known_tags_sends_nothing(self, client):
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", json=[])
 
-        client.add_tag(42, "dub")
+        client.bulk_edit_tags([1], ["dub"], "remove")
 
-        # Should not have created a new tag
-        assert len([c for c in responses.calls if c.request.method == "POST"]) == 0
+        assert len(responses.calls) == 1
 
     @responses.activate
-    def test_does_not_add_duplicate_tag(self, client):
-        """Test that tag is not added if series already has it."""
-        responses.add(
-            responses.GET,
-            "http://sonarr:8989/api/v3/tag",
-            json=[{"id": 5, "label": "dub"}],
-        )
+    def test_updates_cached_series_tags(self, client):
         responses.add(
             responses.GET,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "title": "Test", "tags": [5]},  # Already has tag
-        )
-        responses.add(
-            responses.PUT,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "title": "Test", "tags": [5]},
+            "http://sonarr:8989/api/v3/series",
+            json=[
+                {"id": 1, "path": "/tv/A", "tags": [5, 7]},
+                {"id": 2, "path": "/tv/B", "tags": [7]},
+            ],
         )
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", json=[{"id": 5, "label": "dub"}])
+        responses.add(responses.PUT, "http://sonarr:8989/api/v3/series/editor", json=[])
+        client.get_series_by_path("/tv/A")
 
-        client.add_tag(42, "dub")
+        client.bulk_edit_tags([1, 2, 99], ["dub"], "add")
+        assert client.get_series_by_path("/tv/B")["tags"] == [7, 5]
+        assert client.get_series_by_path("/tv/A")["tags"] == [5, 7]
 
-        # PUT should still be called but tag list unchanged
-        put_calls = [c for c in responses.calls if c.request.method == "PUT"]
-        assert len(put_calls) == 1
+        client.bulk_edit_tags([1], ["dub"], "remove")
+        assert client.get_series_by_path("/tv/A")["tags"] == [7]
 
+    @responses.activate
+    def test_splits_large_id_lists_into_batches(self, client, monkeypatch):
+        monkeypatch.setattr("taggarr.services.sonarr.EDITOR_BATCH_SIZE", 2)
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", json=[{"id": 5, "label": "dub"}])
+        responses.add(responses.PUT, "http://sonarr:8989/api/v3/series/editor", json=[])
 
-class TestRemoveTag:
-    """Tests for remove_tag method."""
+        client.bulk_edit_tags([1, 2, 3, 4, 5], ["dub"], "add")
+
+        put_calls = [c for c in responses.calls if c.request.method == "PUT"]
+        assert [json.loads(c.request.body)["seriesIds"] for c in put_calls] == [[1, 2], [3, 4], [5]]
 
     @responses.activate
-    def test_removes_tag_from_series(self, client):
-        # Mock get tags
+    def test_only_sends_ids_whose_tags_differ(self, client):
         responses.add(
             responses.GET,
-            "http://sonarr:8989/api/v3/tag",
-            json=[{"id": 5, "label": "dub"}],
-        )
-        # Mock get series (has the tag)
-        responses.add(
-            responses.GET,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "title": "Test", "tags": [5]},
-        )
-        # Mock update series
-        responses.add(
-            responses.PUT,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "title": "Test", "tags": []},
+            "http://sonarr:8989/api/v3/series",
+            json=[
+                {"id": 1, "path": "/lib/A", "tags": [5]},
+                {"id": 2, "path": "/lib/B", "tags": []},
+            ],
         )
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", json=[{"id": 5, "label": "dub"}])
+        responses.add(responses.PUT, "http://sonarr:8989/api/v3/series/editor", json=[])
+        client.get_series_by_path("/lib/A")
 
-        client.remove_tag(42, "dub")
+        client.bulk_edit_tags([1, 2, 3], ["dub"], "add")
+        client.bulk_edit_tags([2], ["dub"], "add")
+        client.bulk_edit_tags([1], ["dub"], "remove")
 
-        # Verify PUT was called
         put_calls = [c for c in responses.calls if c.request.method == "PUT"]
-        assert len(put_calls) == 1
+        assert [json.loads(c.request.body)["seriesIds"] for c in put_calls] == [[2, 3], [1]]
 
     @responses.activate
-    def test_does_nothing_if_tag_not_found(self, client):
-        # Mock get tags (tag doesn't exist)
+    def test_skips_request_when_already_up_to_date(self, client, caplog):
+        caplog.set_level(logging.DEBUG, logger="taggarr")
         responses.add(
             responses.GET,
-            "http://sonarr:8989/api/v3/tag",
-            json=[],
+            "http://sonarr:8989/api/v3/series",
+            json=[{"id": 1, "path": "/lib/A", "tags": [5]}],
         )
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", json=[{"id": 5, "label": "dub"}, {"id": 6, "label": "semi-dub"}])
+        client.get_series_by_path("/lib/A")
+
+        client.bulk_edit_tags([1], ["dub"], "add")
+        client.bulk_edit_tags([1], ["semi-dub"], "remove")
+
+        assert all(c.request.method == "GET" for c in responses.calls)
+        assert "already up to date" in caplog.text
 
-        # Should not throw
-        client.remove_tag(42, "nonexistent")
+    def test_empty_ids_does_nothing(self, client):
+        # No responses registered: any request would raise
+        client.bulk_edit_tags([], ["dub"], "add")
 
     def test_dry_run_does_not_call_api(self, client, caplog):
         caplog.set_level(logging.INFO)
-        client.remove_tag(42, "dub", dry_run=True)
+        client.bulk_edit_tags([1, 2], ["dub"], "add", dry_run=True)
         assert "Dry Run" in caplog.text
 
+    @responses.activate
+    def test_handles_api_error(self, client, caplog):
+        caplog.set_level(logging.WARNING)
+        responses.add(
+            responses.GET,
+            "http://sonarr:8989/api/v3/tag",
+            body=Exception("Connection refused"),
+        )
+        responses.add(
+            responses.POST,
+            "http://sonarr:8989/api/v3/tag",
+            body=Exception("Connection refused"),
+        )
+
+        client.bulk_edit_tags([1], ["dub"], "add")
+
+        assert "Failed to bulk edit" in caplog.text
+
 
 class TestRefreshSeries:
     """Tests for refresh_series method."""
@@ -351,39 +388,78 @@ class TestGetTagId:
         result = client._get_tag_id("dub")
 
         assert result is None
+        assert client._tag_cache is None
 
+    @responses.activate
+    def test_fetches_tag_list_only_once(self, client):
+        responses.add(
+            responses.GET,
+            "http://sonarr:8989/api/v3/tag",
+            json=[
+                {"id": 1, "label": "dub"},
+                {"id": 2, "label": "semi-dub"},
+            ],
+        )
 
-class TestModifySeriesTags:
-    """Tests for _modify_series_tags method."""
+        assert client._get_tag_id("dub") == 1
+        assert client._get_tag_id("semi-dub") == 2
+        assert client._get_tag_id("wrong-dub") is None
+
+        assert len(responses.calls) == 1
 
     @responses.activate
-    def test_handles_api_error(self, client, caplog):
-        caplog.set_level(logging.WARNING)
+    def test_created_tag_is_cached(self, client):
         responses.add(
             responses.GET,
-            "http://sonarr:8989/api/v3/series/42",
-            status=500,
+            "http://sonarr:8989/api/v3/tag",
+            json=[{"id": 1, "label": "dub"}],
+        )
+        responses.add(
+            responses.POST,
+            "http://sonarr:8989/api/v3/tag",
+            json={"id": 7, "label": "wrong-dub"},
         )
 
-        # Should not raise
-        client._modify_series_tags(42, 1, remove=False)
+        assert client._get_or_create_tag("wrong-dub") == 7
+        assert client._get_tag_id("wrong-dub") == 7
 
-        assert "Failed to modify" in caplog.text
+        get_calls = [c for c in responses.calls if c.request.method == "GET"]
+        assert len(get_calls) == 1
 
     @responses.activate
-    def test_removes_tag_when_present(self, client):
+    def test_created_tag_not_cached_when_list_unavailable(self, client):
         responses.add(
             responses.GET,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "tags": [1, 2, 3]},
+            "http://sonarr:8989/api/v3/tag",
+            status=500,
         )
         responses.add(
-            responses.PUT,
-            "http://sonarr:8989/api/v3/series/42",
-            json={"id": 42, "tags": [1, 3]},
+            responses.POST,
+            "http://sonarr:8989/api/v3/tag",
+            json={"id": 7, "label": "dub"},
         )
 
-        client._modify_series_tags(42, 2, remove=True)
+        assert client._get_or_create_tag("dub") == 7
+        assert client._tag_cache is None
+
+
+class TestDecode:
+    """Tests for _decode helper."""
+
+    @responses.activate
+    def test_uses_orjson_when_available(self, monkeypatch):
+        fake = Mock()
+        fake.loads.return_value = [{"id": 1}]
+        monkeypatch.setattr(sonarr, "orjson", fake)
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", body=b'[{"id": 1}]')
+
+        assert sonarr._decode(requests.get("http://sonarr:8989/api/v3/tag")) == [{"id": 1}]
+        fake.loads.assert_called_once_with(b'[{"id": 1}]')
+
+    @responses.activate
+    def test_falls_back_to_response_json(self, monkeypatch):
+        monkeypatch.setattr(sonarr, "orjson", None)
+        responses.add(responses.GET, "http://sonarr:8989/api/v3/tag", json=[{"id": 1}])
+
+        assert sonarr._decode(requests.get("http://sonarr:8989/api/v3/tag")) == [{"id": 1}]
 
-        put_calls = [c for c in responses.calls if c.request.method == "PUT"]
-        assert len(put_calls) == 1
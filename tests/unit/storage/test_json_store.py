@@ -3,8 +3,11 @@
 import json
 import logging
 import os
+import re
 import pytest
+from unittest.mock import patch
 
+from taggarr import __version__
 from taggarr.storage import json_store
 
 
@@ -57,6 +60,44 @@ class TestLoad:
         assert (tmp_path / "taggarr.json.bak").exists()
         assert "corrupted" in caplog.text
 
+    def test_loads_locale_encoded_file_without_backup(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(json_store.locale, "getpreferredencoding", lambda do_setlocale: "cp1252")
+        json_path = tmp_path / "taggarr.json"
+        json_path.write_bytes('{"series": {"/tv/Amélie": {"tag": "dub"}}}'.encode("cp1252"))
+
+        result = json_store.load(str(json_path))
+
+        assert result["series"]["/tv/Amélie"]["tag"] == "dub"
+        assert not (tmp_path / "taggarr.json.bak").exists()
+
+
+class TestLoads:
+    """Tests for _loads function."""
+
+    def test_uses_orjson_when_available(self, monkeypatch):
+        fake = type("FakeOrjson", (), {"loads": staticmethod(lambda raw: {"fast": True})})
+        monkeypatch.setattr(json_store, "orjson", fake)
+
+        assert json_store._loads(b'{"fast": false}') == {"fast": True}
+
+    def test_falls_back_to_stdlib_json(self, monkeypatch):
+        monkeypatch.setattr(json_store, "orjson", None)
+
+        assert json_store._loads(b'{"series": {}}') == {"series": {}}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_falls_back_to_locale_encoding(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(json_store, "orjson", None)
+        monkeypatch.setattr(json_store.locale, "getpreferredencoding", lambda do_setlocale: "cp1252")
+        raw = '{"series": {"Pokémon": {}}}'.encode("cp1252")
+
+        assert json_store._loads(raw) == {"series": {"Pokémon": {}}}
+
+    def test_invalid_json_still_raises(self):
+        with pytest.raises(ValueError):
+            json_store._loads(b"not valid json {{{")
+
 
 class TestSave:
     """Tests for save function."""
@@ -94,6 +135,114 @@ class TestSave:
         # Version should appear before series in the JSON
         assert content.index('"version"') < content.index('"series"')
 
+    def test_skips_write_when_content_unchanged(self, tmp_path, caplog):
+        caplog.set_level(logging.DEBUG, logger="taggarr")
+        json_path = tmp_path / "taggarr.json"
+        data = {"series": {"show1": {"tag": "dub"}}}
+
+        json_store.save(str(json_path), data)
+        os.utime(json_path, (0, 0))
+        json_store.save(str(json_path), data)
+
+        assert os.path.getmtime(json_path) == 0
+        assert "skipping write" in caplog.text
+
+    def test_unchanged_save_does_not_open_file(self, tmp_path):
+        json_path = tmp_path / "taggarr.json"
+        data = {"series": {"show1": {"tag": "dub"}}}
+
+        json_store.save(str(json_path), data)
+        with patch("builtins.open") as mock_open:
+            json_store.save(str(json_path), data)
+
+        mock_open.assert_not_called()
+        assert os.listdir(tmp_path) == ["taggarr.json"]
+
+    def test_serialises_once_per_save(self, tmp_path):
+        json_path = tmp_path / "taggarr.json"
+
+        with patch("taggarr.storage.json_store._iter_json", wraps=json_store._iter_json) as mock_iter:
+            json_store.save(str(json_path), {"series": {"show1": {"tag": "dub"}}})
+
+        # Nested values recurse through the patched name; count top-level calls only
+        top_level = [c for c in mock_iter.call_args_list if len(c.args) == 1]
+        assert len(top_level) == 1
+
+    def test_writes_when_content_changes(self, tmp_path):
+        json_path = tmp_path / "taggarr.json"
+
+        json_store.save(str(json_path), {"series": {"show1": {"tag": "dub"}}})
+        json_store.save(str(json_path), {"series": {"show1": {"tag": "semi-dub"}}})
+
+        loaded = json.loads(json_path.read_text())
+        assert loaded["series"]["show1"]["tag"] == "semi-dub"
+
+    def test_skips_write_after_loading_identical_content(self, tmp_path):
+        json_path = tmp_path / "taggarr.json"
+        json_store.save(str(json_path), {"series": {"show1": {"tag": "dub"}}})
+        json_store._saved_digests.clear()
+
+        data = json_store.load(str(json_path))
+        os.utime(json_path, (0, 0))
+        json_store.save(str(json_path), data)
+
+        assert os.path.getmtime(json_path) == 0
+
+    def test_rewrites_deleted_file_with_same_content(self, tmp_path):
+        json_path = tmp_path / "taggarr.json"
+        data = {"series": {}}
+
+        json_store.save(str(json_path), data)
+        json_path.unlink()
+        json_store.save(str(json_path), data)
+
+        assert json_path.exists()
+
+    def test_skips_serialising_when_nothing_dirty(self, tmp_path, caplog):
+        caplog.set_level(logging.DEBUG, logger="taggarr")
+        json_path = tmp_path / "taggarr.json"
+        json_store.save(str(json_path), {"series": {"show1": {"tag": "dub"}}})
+        data = json_store.load(str(json_path))
+        os.utime(json_path, (0, 0))
+
+        with patch("taggarr.storage.json_store._iter_json") as mock_iter:
+            json_store.save(str(json_path), data, dirty=set())
+
+        mock_iter.assert_not_called()
+        assert os.path.getmtime(json_path) == 0
+        assert "No taggarr.json entries changed" in caplog.text
+
+    def test_writes_when_entries_dirty(self, tmp_path):
+        json_path = tmp_path / "taggarr.json"
+        json_store.save(str(json_path), {"series": {"show1": {"tag": "dub"}}})
+        data = json_store.load(str(json_path))
+        data["series"]["show1"] = {"tag": "semi-dub"}
+
+        json_store.save(str(json_path), data, dirty={"show1"})
+
+        assert json.loads(json_path.read_text())["series"]["show1"]["tag"] == "semi-dub"
+
+    def test_dirty_save_skips_digest_check(self, tmp_path):
+        json_path = tmp_path / "taggarr.json"
+        data = {"series": {"show1": {"tag": "dub"}}}
+        json_store.save(str(json_path), data)
+        os.utime(json_path, (0, 0))
+
+        with patch("taggarr.storage.json_store._digest") as mock_digest:
+            json_store.save(str(json_path), data, dirty={"show1"})
+
+        mock_digest.assert_not_called()
+        assert os.path.getmtime(json_path) != 0
+
+    def test_writes_when_version_outdated(self, tmp_path):
+        json_path = tmp_path / "taggarr.json"
+        json_path.write_text('{"version": "0.0.1", "series": {}}')
+        data = json_store.load(str(json_path))
+
+        json_store.save(str(json_path), data, dirty=set())
+
+        assert json.loads(json_path.read_text())["version"] == __version__
+
     def test_handles_save_error(self, tmp_path, caplog):
         caplog.set_level(logging.WARNING)
         # Try to write to a directory (should fail)
@@ -103,42 +252,81 @@ class TestSave:
         json_store.save(str(dir_path), {"series": {}})
 
         assert "Failed to save" in caplog.text
+        assert not os.path.exists(str(dir_path) + ".tmp")
+
+    def test_handles_unwritable_directory(self, tmp_path, caplog):
+        caplog.set_level(logging.WARNING)
+        json_path = tmp_path / "missing" / "taggarr.json"
+
+        json_store.save(str(json_path), {"series": {}})
+
+        assert "Failed to save" in caplog.text
+
+
+class TestChangedKeys:
+    """Tests for changed_keys function."""
 
+    def test_detects_added_replaced_and_removed_entries(self):
+        kept, old = {"tag": "dub"}, {"tag": "dub"}
+        before = {"kept": kept, "replaced": old, "removed": {}}
+        after = {"kept": kept, "replaced": {"tag": "dub"}, "added": {}}
 
-class TestCompactLists:
-    """Tests for _compact_lists function."""
+        assert json_store.changed_keys(before, after) == {"replaced", "removed", "added"}
 
-    def test_compacts_episode_lists(self):
-        raw = '[\n  "E01",\n  "E02",\n  "E03"\n]'
-        result = json_store._compact_lists(raw)
-        assert result == '["E01", "E02", "E03"]'
+    def test_empty_when_untouched(self):
+        entries = {"a": {}, "b": {}}
 
-    def test_compacts_dub_language_lists(self):
-        raw = '"dub": [\n  "en",\n  "ja"\n]'
-        result = json_store._compact_lists(raw)
-        assert '"dub": ["en", "ja"]' in result
+        assert json_store.changed_keys(dict(entries), entries) == set()
 
-    def test_compacts_original_dub_list(self):
-        raw = '"original_dub": [\n  "E01",\n  "E02"\n]'
-        result = json_store._compact_lists(raw)
+
+class TestScanTime:
+    """Tests for scan_time function."""
+
+    def test_is_utc_iso_with_microseconds(self):
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}Z", json_store.scan_time())
+
+
+class TestIterJson:
+    """Tests for _iter_json function."""
+
+    @staticmethod
+    def render(value):
+        return "".join(json_store._iter_json(value))
+
+    def test_inlines_episode_lists(self):
+        result = self.render({"episodes": ["E01", "E02", "E03"]})
+        assert '"episodes": ["E01", "E02", "E03"]' in result
+
+    def test_inlines_dub_language_lists(self):
+        result = self.render({"dub": ["E01:en", "E02:ja"]})
+        assert '"dub": ["E01:en", "E02:ja"]' in result
+
+    def test_inlines_original_dub_list(self):
+        result = self.render({"original_dub": ["E01", "E02"]})
         assert '"original_dub": ["E01", "E02"]' in result
 
-    def test_compacts_missing_dub_list(self):
-        raw = '"missing_dub": [\n  "E03",\n  "E04"\n]'
-        result = json_store._compact_lists(raw)
-        assert '"missing_dub": ["E03", "E04"]' in result
+    def test_inlines_missing_dub_list(self):
+        result = self.render({"missing_dub": ["E03:en", "E04:en"]})
+        assert '"missing_dub": ["E03:en", "E04:en"]' in result
 
-    def test_compacts_unexpected_languages_list(self):
-        raw = '"unexpected_languages": [\n  "de",\n  "fr"\n]'
-        result = json_store._compact_lists(raw)
+    def test_inlines_unexpected_languages_list(self):
+        result = self.render({"unexpected_languages": ["de", "fr"]})
         assert '"unexpected_languages": ["de", "fr"]' in result
 
-    def test_compacts_languages_list(self):
-        raw = '"languages": [\n  "en",\n  "es"\n]'
-        result = json_store._compact_lists(raw)
+    def test_inlines_languages_list(self):
+        result = self.render({"languages": ["en", "es"]})
         assert '"languages": ["en", "es"]' in result
 
-    def test_preserves_other_formatting(self):
-        raw = '{\n  "name": "test",\n  "value": 123\n}'
-        result = json_store._compact_lists(raw)
-        assert result == raw
+    def test_indents_other_lists(self):
+        result = self.render({"other": ["a", "b"]})
+        assert result == '{\n  "other": [\n    "a",\n    "b"\n  ]\n}'
+
+    def test_matches_json_dumps_for_plain_data(self):
+        data = {"name": "tést", "value": 123, "nested": {"a": None, "b": True}, "empty": {}}
+        assert self.render(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_output_round_trips(self):
+        data = {"series": {"/tv/Show": {"seasons": {"Season 01": {
+            "original_dub": ["E01"], "dub": [], "last_modified": 1.5,
+        }}}}}
+        assert json.loads(self.render(data)) == data
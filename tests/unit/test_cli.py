@@ -0,0 +1,43 @@
+"""Tests for taggarr.cli module."""
+
+import pytest
+
+from taggarr import cli
+
+
+class TestGetParser:
+    """Tests for get_parser function."""
+
+    def test_returns_same_parser_instance(self):
+        assert cli.get_parser() is cli.get_parser()
+
+
+class TestParseArgs:
+    """Tests for parse_args function."""
+
+    def test_defaults(self):
+        opts = cli.parse_args([])
+
+        assert opts.config is None
+        assert opts.instances is None
+        assert opts.write_mode == 0
+        assert opts.quick is False
+        assert opts.dry_run is False
+        assert opts.loop is False
+
+    def test_parses_all_flags(self):
+        opts = cli.parse_args([
+            "-c", "/etc/taggarr.yaml", "-i", "sonarr,radarr",
+            "--write-mode", "2", "--quick", "--dry-run", "--loop",
+        ])
+
+        assert opts.config == "/etc/taggarr.yaml"
+        assert opts.instances == "sonarr,radarr"
+        assert opts.write_mode == 2
+        assert opts.quick is True
+        assert opts.dry_run is True
+        assert opts.loop is True
+
+    def test_rejects_invalid_write_mode(self):
+        with pytest.raises(SystemExit):
+            cli.parse_args(["--write-mode", "5"])
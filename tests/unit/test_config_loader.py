@@ -162,6 +162,29 @@ instances:
         config = _parse_config(config_file)
         assert config.instances["test"].target_genre == "anime"
 
+    def test_parses_scan_workers_with_instance_override(self, tmp_path):
+        config_file = tmp_path / "workers.yaml"
+        config_file.write_text("""
+defaults:
+  scan_workers: 2
+instances:
+  inherits:
+    type: sonarr
+    url: http://localhost
+    api_key: key
+    root_path: /media
+  overrides:
+    type: sonarr
+    url: http://localhost
+    api_key: key
+    root_path: /media
+    scan_workers: 8
+""")
+        config = _parse_config(config_file)
+        assert config.defaults.scan_workers == 2
+        assert config.instances["inherits"].scan_workers == 2
+        assert config.instances["overrides"].scan_workers == 8
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
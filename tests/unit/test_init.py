@@ -243,7 +243,9 @@ class TestProcessInstance:
 
         expected_path = str(tmp_path / "taggarr.json")
         mock_load.assert_called_once_with(expected_path, key="series")
-        mock_save.assert_called_once()
+        mock_save.assert_called_once_with(
+            expected_path, {"series": {"show": {}}}, key="series", dirty={"show"}
+        )
 
 
 class TestRunLoop:
@@ -50,6 +50,33 @@ class TestGetAliases:
         assert "grc" in result
         assert "ancient greek (to 1453)" in result
 
+    def test_returns_cached_frozenset(self):
+        first = languages.get_aliases("en")
+        second = languages.get_aliases("en")
+        assert isinstance(first, frozenset)
+        assert first is second
+
+
+class TestFindLanguage:
+    """Tests for _find_language function."""
+
+    def test_index_contains_codes_and_names(self):
+        index = languages._language_index()
+        assert index["en"].alpha_3 == "eng"
+        assert index["jpn"].name == "Japanese"
+        assert index["english"].alpha_2 == "en"
+
+    def test_falls_back_to_pycountry_lookup(self, monkeypatch):
+        monkeypatch.setattr(languages, "_language_index", lambda: {})
+
+        result = languages._find_language("English")
+
+        assert result.alpha_2 == "en"
+
+    def test_raises_for_unknown_language(self):
+        with pytest.raises(LookupError):
+            languages._find_language("notareallanguage123")
+
 
 class TestGetPrimaryCode:
     """Tests for get_primary_code function."""
@@ -1,6 +1,7 @@
 """Tests for taggarr.nfo module."""
 
 import logging
+import os
 import pytest
 import xml.etree.ElementTree as ET
 
@@ -45,6 +46,24 @@ class TestSafeParse:
         assert root.tag == "movie"
 
 
+class TestLoad:
+    """Tests for load function."""
+
+    def test_returns_root(self, tmp_path):
+        nfo_path = tmp_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow><title>Test</title></tvshow>")
+
+        assert nfo.load(str(nfo_path)).tag == "tvshow"
+
+    def test_returns_none_on_parse_error(self, tmp_path, caplog):
+        caplog.set_level(logging.WARNING)
+        nfo_path = tmp_path / "bad.nfo"
+        nfo_path.write_text("not xml <<<")
+
+        assert nfo.load(str(nfo_path)) is None
+        assert "NFO parsing failed" in caplog.text
+
+
 class TestGetGenres:
     """Tests for get_genres function."""
 
@@ -82,6 +101,13 @@ class TestGetGenres:
         assert result == []
         assert "Genre parsing failed" in caplog.text
 
+    def test_uses_parsed_root_without_reading_file(self, tmp_path):
+        root = ET.fromstring("<tvshow><genre>Anime</genre></tvshow>")
+
+        result = nfo.get_genres(str(tmp_path / "missing.nfo"), root)
+
+        assert result == ["anime"]
+
     def test_skips_empty_genre_elements(self, tmp_path):
         nfo_path = tmp_path / "tvshow.nfo"
         nfo_path.write_text("<tvshow><genre></genre><genre>Action</genre></tvshow>")
@@ -167,6 +193,113 @@ class TestUpdateTag:
         assert "<tag>dub</tag>" in content
 
 
+    def test_reuses_parsed_root(self, tmp_path):
+        nfo_path = tmp_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow><title>Test</title></tvshow>\n</tvshow>")
+        root = nfo.safe_parse(str(nfo_path))
+
+        nfo.update_tag(str(nfo_path), "dub", root=root)
+
+        content = nfo_path.read_text()
+        assert "<tag>dub</tag>" in content
+        assert content.count("</tvshow>") == 1
+
+
+    def test_preserves_existing_indentation(self, tmp_path):
+        nfo_path = tmp_path / "tvshow.nfo"
+        nfo_path.write_text(
+            "<tvshow>\n    <title>Test</title>\n    <tag>semi-dub</tag>\n"
+            "    <genre>Anime</genre>\n</tvshow>"
+        )
+
+        nfo.update_tag(str(nfo_path), "dub")
+
+        assert nfo_path.read_text() == (
+            "<tvshow>\n    <tag>dub</tag>\n    <title>Test</title>\n"
+            "    <genre>Anime</genre>\n</tvshow>"
+        )
+
+    def test_removing_last_child_keeps_closing_tag_layout(self, tmp_path):
+        nfo_path = tmp_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow>\n  <title>Test</title>\n  <tag>dub</tag>\n</tvshow>")
+
+        nfo.update_tag(str(nfo_path), "wrong-dub")
+
+        assert nfo_path.read_text() == (
+            "<tvshow>\n  <tag>wrong-dub</tag>\n  <title>Test</title>\n</tvshow>"
+        )
+
+    def test_indents_unformatted_nfo(self, tmp_path):
+        nfo_path = tmp_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow><title>Test</title></tvshow>")
+
+        nfo.update_tag(str(nfo_path), "dub")
+
+        assert nfo_path.read_text() == (
+            "<tvshow>\n  <tag>dub</tag>\n  <title>Test</title>\n</tvshow>"
+        )
+
+
+    def test_skips_write_when_tag_already_current(self, tmp_path, caplog):
+        caplog.set_level(logging.DEBUG, logger="taggarr")
+        nfo_path = tmp_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow>\n  <title>Test</title>\n</tvshow>")
+
+        nfo.update_tag(str(nfo_path), "dub")
+        os.utime(nfo_path, (1000, 1000))
+        nfo.update_tag(str(nfo_path), "dub")
+
+        assert os.path.getmtime(nfo_path) == 1000
+        assert "already current" in caplog.text
+
+
+class TestWriteIfChanged:
+    """Tests for _write_if_changed function."""
+
+    def test_writes_new_file(self, tmp_path):
+        nfo_path = tmp_path / "new.nfo"
+        tree = ET.ElementTree(ET.fromstring("<tvshow />"))
+
+        assert nfo._write_if_changed(tree, str(nfo_path)) is True
+        assert nfo_path.read_text() == "<tvshow />"
+
+    def test_leaves_identical_file_alone(self, tmp_path):
+        nfo_path = tmp_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow />")
+        os.utime(nfo_path, (1000, 1000))
+        tree = ET.ElementTree(ET.fromstring("<tvshow/>"))
+
+        assert nfo._write_if_changed(tree, str(nfo_path)) is False
+        assert os.path.getmtime(nfo_path) == 1000
+
+
+class TestInsertChild:
+    """Tests for _insert_child function."""
+
+    def test_appends_after_single_child(self):
+        root = ET.fromstring("<r>\n  <a/>\n</r>")
+
+        nfo._insert_child(root, 1, ET.Element("b"))
+
+        assert ET.tostring(root, encoding="unicode") == "<r>\n  <a />\n  <b />\n</r>"
+
+    def test_appends_after_several_children(self):
+        root = ET.fromstring("<r>\n  <a/>\n  <b/>\n</r>")
+
+        nfo._insert_child(root, 2, ET.Element("c"))
+
+        assert ET.tostring(root, encoding="unicode") == (
+            "<r>\n  <a />\n  <b />\n  <c />\n</r>"
+        )
+
+    def test_inserts_into_empty_parent(self):
+        root = ET.fromstring("<r></r>")
+
+        nfo._insert_child(root, 0, ET.Element("a"))
+
+        assert ET.tostring(root, encoding="unicode") == "<r><a /></r>"
+
+
 class TestUpdateMovieTag:
     """Tests for update_movie_tag function."""
 
@@ -258,6 +391,18 @@ class TestUpdateGenre:
         content = nfo_path.read_text()
         assert "<genre>Dub</genre>" in content
 
+    def test_preserves_indentation_when_adding_and_removing(self, tmp_path):
+        nfo_path = tmp_path / "tvshow.nfo"
+        nfo_path.write_text("<tvshow>\n  <title>Test</title>\n</tvshow>")
+
+        nfo.update_genre(str(nfo_path), should_have_dub=True)
+        assert nfo_path.read_text() == (
+            "<tvshow>\n  <title>Test</title>\n  <genre>Dub</genre>\n</tvshow>"
+        )
+
+        nfo.update_genre(str(nfo_path), should_have_dub=False)
+        assert nfo_path.read_text() == "<tvshow>\n  <title>Test</title>\n</tvshow>"
+
     def test_removes_dub_with_case_insensitivity(self, tmp_path):
         """Test that removal works regardless of case."""
         nfo_path = tmp_path / "tvshow.nfo"